@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from configparser import ConfigParser, NoOptionError, NoSectionError
+import atexit
+import io
+import os
+import sys
+import threading
+from configparser import ConfigParser
 from pathlib import Path
 from typing import Any
 
@@ -18,8 +23,17 @@ USER_CONFIGURABLE_DEFAULTS = {
     'code_font': ('Consolas', str),
     'code_font_size': (11, int),
     'expander_icon': ('keyboard_arrow_down', lambda s: str(s).upper()),
+    'events_cache_ttl': (0, int),
 }
 
+# Split out for faster lookups on the hot read path.
+_DEFAULTS = {k: v[0] for k, v in USER_CONFIGURABLE_DEFAULTS.items()}
+_CONVERTERS = {k: v[1] for k, v in USER_CONFIGURABLE_DEFAULTS.items()}
+
+# Settings tend to change in bursts (e.g. window resizing). Writes to the config
+# file are deferred by this many seconds so that a burst results in one write.
+WRITE_DELAY = 0.25
+
 
 # ------------------------------------------------------------------------------
 class GuiConfig:
@@ -28,13 +42,26 @@ class GuiConfig:
 
     This reads config from `~/.lava/config.cfg`. Only the `GUI` key is used.
     This is a singleton.
+
+    The `GUI` section is held as a plain dict. ConfigParser is only used to
+    read the file. Any other sections are preserved verbatim when it is rewritten.
+
+    Changes are serialised by a lock. Reads don't take the lock. They go via the
+    value cache which is replaced, rather than modified, whenever a value is set.
     """
 
-    _config: ConfigParser = None
+    _config: dict[str, str] = None
+    # Values from the [DEFAULT] section. The GUI section inherits these.
+    _file_defaults: dict[str, str] = None
+    _other_sections = ''
+    _cache: dict[str, Any] = None
     cfg_key = 'GUI'
     cfg_file = Path.home() / '.lava' / 'lava.cfg'
     _instance: GuiConfig = None
     _initialised = False
+    _parent_ensured = False
+    defaults = _DEFAULTS
+    converters = _CONVERTERS
 
     # --------------------------------------------------------------------------
     def __new__(cls):
@@ -51,22 +78,89 @@ class GuiConfig:
             return
         self._initialised = True
 
-        self._config = ConfigParser()
-        if self.cfg_file.is_file():
-            self._config.read(self.cfg_file)
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._write_timer: threading.Timer | None = None
+        atexit.register(self.flush)
+
+        # Converted values, keyed on item name. Entries are refreshed by set().
+        self._cache = {}
+        parser = ConfigParser(interpolation=None)
+        # ConfigParser.read() quietly skips missing files, so no need to stat first.
+        parser.read(self.cfg_file)
+        self._config = {}
+        self._file_defaults = defaults = dict(parser.defaults())
+        if parser.has_section(self.cfg_key):
+            # Section items include [DEFAULT] values. Keep only the section's own
+            # so they don't get written into it. An override matching its default
+            # can be dropped as [DEFAULT] still supplies it.
+            self._config = {
+                k: v
+                for k, v in parser.items(self.cfg_key, raw=True)
+                if k not in defaults or v != defaults[k]
+            }
+            parser.remove_section(self.cfg_key)
+
+        # We never change other sections so render them once now.
+        buf = io.StringIO()
+        parser.write(buf)
+        self._other_sections = buf.getvalue()
 
-        for key, (default, _) in USER_CONFIGURABLE_DEFAULTS.items():
+        for key, default in self.defaults.items():
             self.set_default(key, default)
 
     # --------------------------------------------------------------------------
     def _write(self):
         """Write config to filesystem."""
 
-        if not self.cfg_file.parent.exists():
-            self.cfg_file.parent.mkdir(parents=True)
+        if not GuiConfig._parent_ensured:
+            self.cfg_file.parent.mkdir(parents=True, exist_ok=True)
+            GuiConfig._parent_ensured = True
+
+        # Write to a temp file and then move it into place so a crash part way
+        # through can't leave a truncated config file behind.
+        tmp_file = self.cfg_file.with_name(self.cfg_file.name + '.tmp')
+        with self._lock:
+            content = self._render()
+            with open(tmp_file, 'w', buffering=1 << 16) as configfile:
+                configfile.write(content)
+            os.replace(tmp_file, self.cfg_file)
+
+    # --------------------------------------------------------------------------
+    def _render(self) -> str:
+        """Render the config file contents in the same format as ConfigParser.write()."""
+
+        lines = [self._other_sections, f'[{self.cfg_key}]\n']
+        for k, v in self._config.items():
+            # Multi-line values need continuation lines indented.
+            v = v.replace('\n', '\n\t')
+            lines.append(f'{k} = {v}\n')
+        lines.append('\n')
+        return ''.join(lines)
+
+    # --------------------------------------------------------------------------
+    def _schedule_write(self):
+        """Mark the config as dirty and (re)start the deferred write timer."""
+
+        with self._lock:
+            self._dirty = True
+            if self._write_timer:
+                self._write_timer.cancel()
+            self._write_timer = threading.Timer(WRITE_DELAY, self.flush)
+            self._write_timer.daemon = True
+            self._write_timer.start()
+
+    # --------------------------------------------------------------------------
+    def flush(self):
+        """Write any pending config changes to the filesystem immediately."""
 
-        with open(self.cfg_file, 'w') as configfile:
-            self._config.write(configfile)
+        with self._lock:
+            if self._write_timer:
+                self._write_timer.cancel()
+                self._write_timer = None
+            if self._dirty:
+                self._dirty = False
+                self._write()
 
     # --------------------------------------------------------------------------
     def __repr__(self):
@@ -84,74 +178,133 @@ class GuiConfig:
     def get(self, item: str, default=None):
         """Get an item from config."""
 
-        try:
-            return self[item]
-        except KeyError:
-            return default
+        found, v = self._lookup(item)
+        return v if found else default
 
     # --------------------------------------------------------------------------
     def set_default(self, item: str, value: Any):
-        """Set a default value for a key and return the current value."""
+        """
+        Set a default value for a key and return the current value.
 
+        Values inherited from the [DEFAULT] section count as set.
+        """
+
+        try:
+            return self._config[item]
+        except KeyError:
+            pass
         try:
-            current_value = self._config.get(self.cfg_key, item)
-        except (NoSectionError, NoOptionError):
+            return self._file_defaults[item]
+        except KeyError:
             self.set(item, str(value))
-            current_value = value
-
-        return current_value
+            return value
 
     # --------------------------------------------------------------------------
     def set(self, key: str, value: str = None):  # noqa: A003
-        """Set an item in config and save to file."""
-        if value is None:
-            # If value is None, we assume we want to remove the key from the config.
-            if self._config.has_section(self.cfg_key):
-                self._config.remove_option(self.cfg_key, key)
-                self._write()
-        else:
-            # If value is provided, set the key-value pair in the config.
-            if not self._config.has_section(self.cfg_key):
-                self._config.add_section(self.cfg_key)
-            self._config.set(self.cfg_key, key, value)
-            self._write()
+        """Set an item in config and schedule a save to file."""
+        with self._lock:
+            # Readers may be using the current cache so publish a new one rather
+            # than modifying it.
+            cache = dict(self._cache)
+            if value is None:
+                # If value is None, we assume we want to remove the key from the config.
+                cache.pop(key, None)
+                removed = self._config.pop(key, None) is not None
+                self._cache = cache
+                if removed:
+                    self._schedule_write()
+            else:
+                # If value is provided, set the key-value pair in the config.
+                value = str(value)
+                self._config[key] = value
+                # Pre-warm the cache so the next read is a single dict hit.
+                cache[key] = self._convert(key, value)
+                self._cache = cache
+                self._schedule_write()
+
+    # --------------------------------------------------------------------------
+    def update(self, items: dict[str, Any]):
+        """
+        Set several items in config and schedule a single save to file.
+
+        Nothing is saved if none of the values have changed.
+        """
+
+        with self._lock:
+            cache = dict(self._cache)
+            changed = False
+            for key, value in items.items():
+                value = str(value)
+                if self._config.get(key, self._file_defaults.get(key)) == value:
+                    continue
+                self._config[key] = value
+                cache[key] = self._convert(key, value)
+                changed = True
+            if changed:
+                self._cache = cache
+                self._schedule_write()
 
     # --------------------------------------------------------------------------
     def __getattr__(self, item: str):
         """Get an attribute from the config."""
 
-        try:
-            v = self._config.get(self.cfg_key, item)
-        except (NoSectionError, NoOptionError):
+        found, v = self._lookup(item)
+        if not found:
             raise AttributeError(item)
-
-        #  Apply a type conversion if we have one, If that fails, return the
-        # default or the raw value.
-        if item in USER_CONFIGURABLE_DEFAULTS:
-            # noinspection PyBroadException
-            try:
-                return USER_CONFIGURABLE_DEFAULTS[item][1](v)
-            except Exception as e:
-                print(f'{item}: {e}')
-                return USER_CONFIGURABLE_DEFAULTS[item][0]
         return v
 
     # --------------------------------------------------------------------------
     def __getitem__(self, item: str):
         """Get an item from config."""
 
-        try:
-            v = self._config.get(self.cfg_key, item)
-        except (NoSectionError, NoOptionError):
+        found, v = self._lookup(item)
+        if not found:
             raise KeyError(item)
+        return v
 
-        # Apply a type conversion if we have one, If that fails, return the
-        # default or the raw value.
-        if item in USER_CONFIGURABLE_DEFAULTS:
+    # --------------------------------------------------------------------------
+    def _lookup(self, item: str) -> tuple[bool, Any]:
+        """
+        Get an item from config without raising an exception if it's missing.
+
+        :param item:    The config item name.
+        :return:        A tuple (found, value). If the item is not present in
+                        the GUI section or [DEFAULT], the value is None.
+        """
+
+        # Hang on to this cache instance. If set() publishes a new one while
+        # we're working, our result must not end up in it.
+        cache = self._cache
+        if item in cache:
+            return True, cache[item]
+
+        try:
+            raw = self._config[item]
+        except KeyError:
+            try:
+                raw = self._file_defaults[item]
+            except KeyError:
+                return False, None
+        v = cache[item] = self._convert(item, raw)
+        return True, v
+
+    # --------------------------------------------------------------------------
+    def _convert(self, item: str, raw: str) -> Any:
+        """
+        Apply the type conversion for an item, if it has one.
+
+        If the conversion fails, the default is returned. String results are
+        interned as the same few values (e.g. font names) get passed around to
+        lots of widgets.
+        """
+
+        v = raw
+        converter = self.converters.get(item)
+        if converter is not None:
             # noinspection PyBroadException
             try:
-                return USER_CONFIGURABLE_DEFAULTS[item][1](v)
+                v = converter(raw)
             except Exception as e:
                 print(f'{item}: {e}')
-                return USER_CONFIGURABLE_DEFAULTS[item][0]
-        return v
+                v = self.defaults[item]
+        return sys.intern(v) if isinstance(v, str) else v
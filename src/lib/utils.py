@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal, ROUND_HALF_UP
+from functools import wraps
 from typing import Any
 
+_MICROSECOND = timedelta(microseconds=1)
+
 
 # ------------------------------------------------------------------------------
 def round_half_up(n):
-    """Round to nearest integer (not bankers rounding)."""
-
+    """Round to nearest integer (not bankers rounding). Halves round away from zero."""
+
+    if isinstance(n, int):
+        return n
+    if isinstance(n, float):
+        # Adding 0.5 can itself round up, so look at the fraction instead. It is
+        # exact as subtracting the floor of a float loses nothing.
+        a = abs(n)
+        i = math.floor(a)
+        if a - i >= 0.5:
+            i += 1
+        return i if n >= 0 else -i
+
+    # Decimal, strings etc. Keep the exact rounding semantics.
     return int(Decimal(n).to_integral_value(rounding=ROUND_HALF_UP))
 
 
@@ -21,35 +37,25 @@ def format_isodate_difference(iso1: str, iso2: str) -> str:
 
     d1 = datetime.fromisoformat(iso1)
     d2 = datetime.fromisoformat(iso2)
-    if not all((d1.tzinfo, d2.tzinfo)):
+    if d1.tzinfo is None or d2.tzinfo is None:
         raise ValueError('Arguments must be timezone-aware')
-    if d1 > d2:
-        sign = '-'
-        d1, d2 = d2, d1
-    else:
-        sign = ''
-
-    diff_seconds = (d2 - d1).total_seconds()
 
-    if diff_seconds < 60:
-        seconds = round_half_up(diff_seconds)
-        return f'{sign}{seconds}s'
-
-    if diff_seconds < 3600:
-        minutes = int(diff_seconds // 60)
-        seconds = round_half_up(diff_seconds % 60)
-        if seconds == 60:
-            minutes += 1
-            seconds = 0
-        return f'{sign}{minutes}m {seconds}s'
+    # Work in integer microseconds to avoid float arithmetic and rounding.
+    diff = d2 - d1
+    sign = '-' if diff.days < 0 else ''
+    diff_us = abs(diff) // _MICROSECOND
+
+    # Rounding to whole units before the divmod takes care of carries.
+    if diff_us < 60_000_000:
+        parts = (f'{(diff_us + 500_000) // 1_000_000}s',)
+    elif diff_us < 3_600_000_000:
+        minutes, seconds = divmod((diff_us + 500_000) // 1_000_000, 60)
+        parts = (f'{minutes}m', f'{seconds}s')
+    else:
+        hours, minutes = divmod((diff_us + 30_000_000) // 60_000_000, 60)
+        parts = (f'{hours}h', f'{minutes}m')
 
-    hours = int(diff_seconds // 3600)
-    remaining_seconds = diff_seconds % 3600
-    minutes = round_half_up(remaining_seconds / 60)
-    if minutes == 60:
-        hours += 1
-        minutes = 0
-    return f'{sign}{hours}h {minutes}m'
+    return sign + ' '.join(parts)
 
 
 # ------------------------------------------------------------------------------
@@ -70,9 +76,60 @@ def suppress_exception(
     :param exc_return:  The value to return in the event of an exception.
     :return:            The return value of the supplied function or exc_return
                         in the event of an exception.
+
+    For repeated calls with the same exception spec, see `make_suppressor`.
     """
 
     try:
         return func(*args, **kwargs)
     except exc:
         return exc_return
+
+
+# ------------------------------------------------------------------------------
+def make_suppressor(
+    exc: type(Exception) | tuple[type(Exception)] = Exception, exc_return=None
+) -> Callable:
+    """
+    Create a specialised version of `suppress_exception` for a fixed exception spec.
+
+    This avoids re-processing the `exc` and `exc_return` keyword arguments on
+    every call, which is worthwhile when used in a loop.
+
+    :param exc:         An exception type or tuple of exception types to suppress.
+    :param exc_return:  The value to return in the event of an exception.
+    :return:            A callable with the signature `call(func, *args, **kwargs)`.
+    """
+
+    def call(func: Callable, /, *args, **kwargs) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except exc:
+            return exc_return
+
+    return call
+
+
+# ------------------------------------------------------------------------------
+def suppressing(
+    exc: type(Exception) | tuple[type(Exception)] = Exception, exc_return=None
+) -> Callable:
+    """
+    Decorate a function so that the specified exception(s) are suppressed.
+
+    :param exc:         An exception type or tuple of exception types to suppress.
+    :param exc_return:  The value to return in the event of an exception.
+    :return:            A decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except exc:
+                return exc_return
+
+        return wrapper
+
+    return decorator
@@ -12,35 +12,50 @@
 
 from __future__ import annotations
 
+import asyncio
 import decimal
+import hashlib
 import json
 import os
 import re
 import threading
-import tomllib
+import time
 import traceback
 from argparse import Namespace
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from functools import cache, partial
+from functools import cache, cached_property, lru_cache, partial
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import boto3
 import flet as ft
 import lava.version
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.client import BaseClient
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from cachetools.func import ttl_cache
-from lava.lavacore import dispatch, get_job_spec, scan_jobs, scan_realms
+from lava.lavacore import dispatch, get_job_spec, scan_realms
 from lava.lib.aws import s3_split
 from lava.lib.misc import json_default
 
 from lib.config import GuiConfig
-from lib.utils import format_isodate_difference, suppress_exception
+from lib.utils import format_isodate_difference, suppressing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError so callers only
+# need to catch the latter.
+json_loads = orjson.loads if orjson else json.loads
 
 DEBUG = False
 
@@ -58,29 +73,104 @@ DISPATCH_BLACKOUT = timedelta(seconds=10)
 # Don't permit new event fetch more frequently than this.
 EVENT_BLACKOUT = timedelta(seconds=10)
 
+# Repeating an identical job log event fetch within this time reuses the results.
+EVENT_FETCH_REUSE = timedelta(seconds=10)
+
+# Fetched events are saved here if the events_cache_ttl config item is set.
+EVENTS_CACHE_DIR = Path.home() / '.lava' / 'gui-cache' / 'events'
+
 # Don't permit check for running jobs more frequently than this.
 RUNNING_JOBS_BLACKOUT = timedelta(seconds=120)
 
+# Cache lifetimes (seconds) for information read from lava. The refresh button
+# discards the caches if the user needs to see changes sooner.
+REALM_LIST_CACHE_TTL = 3600
+JOB_LIST_CACHE_TTL = 120
+JOB_SPEC_CACHE_TTL = 10
+
+# A successful account access check for a profile is reused for this long
+# (seconds). Kept comfortably inside typical SSO credential lifetimes.
+ACCOUNT_ACCESS_CACHE_TTL = 600
+
 # Global Variables that are used
 BORDER_TRANSPARENT = ft.Colors.TRANSPARENT
 TEXTFIELD_WIDTH_SIZE_WORKER = 80
 DATA_CELL_INNER_TEXTBOX_PADDING = ft.Padding(left=0, right=0, top=2, bottom=2)
-GUI_THEMES = {}
+
+# Commonly used layout attributes. These are shared between controls so must
+# not be modified.
+PADDING_NONE = ft.Padding(0, 0, 0, 0)
+PADDING_4 = ft.padding.all(4)
+PADDING_10 = ft.padding.all(10)
+MARGIN_BOTTOM_10 = ft.margin.only(bottom=10)
+MARGIN_BOTTOM_20 = ft.margin.only(bottom=20)
+BORDER_INVISIBLE = ft.border.all(1, color=BORDER_TRANSPARENT)
+BORDER_PRIMARY = ft.border.all(1, ft.Colors.PRIMARY)
+
+# Hover highlighting changes in the job list are sent to the client in batches
+# at most this often (seconds).
+HOVER_UPDATE_DELAY = 0.016
+# The job search waits this long (seconds) for more keystrokes before filtering.
+SEARCH_DELAY = 0.3
 
 # When searching for running jobs look back this many hours
 RUNNING_JOB_LOOKBACK_HOURS = 12
 
-EVENT_STATUS_COLOUR = {
-    'starting': '#333333',
-    'running': 'blue',
-    'complete': '#228822',
-    'logging': '#8888ff',
-    'retrying': '#ff7700',
-    'failed': 'red',
-    'rejected': 'red',
-    'skipped': '#a9a9a9',
-    'action_failed': '#ff9300',
-}
+# Full table scans are split into this many segments which are scanned in parallel.
+SCAN_SEGMENTS = 4
+
+# AWS client connection settings. Connections are kept alive and pooled so that
+# repeated calls don't each pay for a new TLS handshake.
+AWS_MAX_POOL_CONNECTIONS = 50
+AWS_CONNECT_TIMEOUT = 3
+AWS_READ_TIMEOUT = 15
+AWS_RETRIES = {'max_attempts': 5, 'mode': 'adaptive'}
+
+# Blocking AWS calls made from async event handlers run in this many worker
+# threads so the UI stays responsive while they are in flight.
+AWS_IO_WORKERS = 8
+
+# After a profile is selected, job lists for up to this many of its other realms
+# are loaded in the background, this many at a time.
+PRELOAD_REALMS = 8
+PRELOAD_WORKERS = 2
+
+# Large S3 objects (e.g. job logs) are read in chunks of this size, in parallel.
+S3_READ_CHUNK_SIZE = 8 * 1024 * 1024
+S3_READ_WORKERS = 4
+
+# Number of S3 log files to keep in memory for when the user goes back to them.
+S3_TEXT_CACHE_SIZE = 16
+
+EVENT_STATUS_COLOUR = MappingProxyType(
+    {
+        'starting': '#333333',
+        'running': 'blue',
+        'complete': '#228822',
+        'logging': '#8888ff',
+        'retrying': '#ff7700',
+        'failed': 'red',
+        'rejected': 'red',
+        'skipped': '#a9a9a9',
+        'action_failed': '#ff9300',
+    }
+)
+
+# Look for S3 log files mentioned in events. These are the values of any of the
+# LOG_FILE_KEYS or anything that looks like an S3 .out file.
+LOG_FILE_KEYS = frozenset(('stderr', 'stdout', 'output'))
+LOG_FILE_KEYED_RE = re.compile(r's3://[A-Za-z0-9_./-]+')
+LOG_FILE_OUT_RE = re.compile(r's3://[A-Za-z0-9_.:/-]+\.out')
+
+# Dispatch globals / parameter values that are converted without JSON parsing
+DISPATCH_LITERALS = MappingProxyType({'true': True, 'false': False, 'none': None})
+# Dispatch globals / parameter values that look like this are converted to Decimal
+DISPATCH_NUMBER_RE = re.compile(r'\s*-?(\d+\.?\d*|\.\d+)\s*', re.ASCII)
+# Dispatch globals / parameter values of these types are shown as JSON
+DISPATCH_JSON_TYPES = (list, dict)
+
+# Markdown code fence we put at the start of JSON content for highlighting
+JSON_CODE_FENCE = '```json\n'
 
 if DEBUG:
     debug = print
@@ -91,90 +181,206 @@ else:
         pass
 
 
-# Exploit the pyproject.toml file to get some app context information
-with open(Path(__file__).parent / 'assets' / 'pyproject.toml', 'rb') as tfp:
-    app_info = tomllib.load(tfp)
+# Exploit the pyproject.toml file to get some app context information. This is
+# extracted at build time by etc/gen-app-info. If that hasn't been done (e.g.
+# when running from source) we have to read pyproject.toml ourselves.
+try:
+    from _app_info import APP_AUTHORS, APP_COPYRIGHT, APP_PRODUCT, APP_VERSION
+except ImportError:
+    import tomllib
+
+    with open(Path(__file__).parent / 'assets' / 'pyproject.toml', 'rb') as tfp:
+        _app_info = tomllib.load(tfp)
+    APP_VERSION = _app_info['project']['version']
+    APP_PRODUCT = _app_info['tool']['flet']['product']
+    APP_COPYRIGHT = _app_info['tool']['flet']['copyright']
+    APP_AUTHORS = tuple(author['name'] for author in _app_info['project']['authors'])
 
 APP_INFO = '\n'.join(
     (
         '',
-        f'GUI Version: {app_info["project"]["version"]} (Flet)',
+        f'GUI Version: {APP_VERSION} (Flet)',
         f'Lava Version: {lava.version.__version__}',
         '',
         'Flet GUI Created by:',
-        *(f'    {author["name"]}' for author in app_info['project']['authors']),
+        *(f'    {author}' for author in APP_AUTHORS),
         '',
-        f'{app_info["tool"]["flet"]["copyright"]}',
+        APP_COPYRIGHT,
     )
 )
 
 # ------------------------------------------------------------------------------
 # Some macros for common widgets.
 # Defined as partial rather than constants so we can override parameters.
-DetailTextStyle = partial(ft.TextStyle, size=GuiConfig().details_font_size, color=ft.Colors.PRIMARY)
+# The config is resolved once here rather than on every widget creation.
+_details_font_size = GuiConfig().details_font_size
+_heading_font_size = GuiConfig().heading_font_size
+_code_font = GuiConfig().code_font
+_code_font_size = GuiConfig().code_font_size
+
+DetailTextStyle = partial(ft.TextStyle, size=_details_font_size, color=ft.Colors.PRIMARY)
 DetailTextBoldStyle = partial(
     ft.TextStyle,
-    size=GuiConfig().details_font_size,
+    size=_details_font_size,
     color=ft.Colors.PRIMARY,
     weight=ft.FontWeight.BOLD,
 )
-CodeTextStyle = partial(
-    ft.TextStyle, font_family=GuiConfig().code_font, size=GuiConfig().code_font_size
-)
+CodeTextStyle = partial(ft.TextStyle, font_family=_code_font, size=_code_font_size)
+
+# Shared style instances for the common case where no overrides are needed. These
+# must not be modified.
+DETAIL_STYLE = DetailTextStyle()
+DETAIL_BOLD_STYLE = DetailTextBoldStyle()
+CODE_STYLE = CodeTextStyle()
+
 JobListText = partial(
     ft.Text,
-    font_family=GuiConfig().code_font,
-    size=GuiConfig().details_font_size,
+    font_family=_code_font,
+    size=_details_font_size,
     color=ft.Colors.PRIMARY,
 )
-DetailText = partial(ft.Text, style=DetailTextStyle())
-DetailTextBold = partial(ft.Text, style=DetailTextBoldStyle())
+DetailText = partial(ft.Text, style=DETAIL_STYLE)
+DetailTextBold = partial(ft.Text, style=DETAIL_BOLD_STYLE)
 HeadingText = partial(
-    ft.Text, size=GuiConfig().heading_font_size, color=ft.Colors.PRIMARY, weight=ft.FontWeight.BOLD
+    ft.Text, size=_heading_font_size, color=ft.Colors.PRIMARY, weight=ft.FontWeight.BOLD
 )
 ColumnHeadingText = partial(
     ft.Text,
-    size=GuiConfig().details_font_size,
+    size=_details_font_size,
     color=ft.Colors.SECONDARY,
     weight=ft.FontWeight.BOLD,
 )
+# Editable text in globals / parameters table cells
+DataCellTextField = partial(
+    ft.TextField,
+    text_style=DETAIL_STYLE,
+    multiline=True,
+    border_color=BORDER_TRANSPARENT,
+    content_padding=DATA_CELL_INNER_TEXTBOX_PADDING,
+)
+# As above for rows added by the user
+NewDataCellTextField = partial(DataCellTextField, height=18, text_align=ft.TextAlign.LEFT)
+
+
+# ------------------------------------------------------------------------------
+# Elapsed time between two ISO timestamps or an empty string if that can't be done.
+format_elapsed = suppressing(exc_return='')(format_isodate_difference)
 
 
 # ------------------------------------------------------------------------------
 KEY_PAGE_REFERENCES: dict[str, Any] = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class RealmCache:
     """For returning to a realm to where you left off."""
 
     last_search: str = ''
     last_selected_job_id: str = None
+    # Sorted job IDs from the last visit. Shown while the job list is refreshed.
+    job_list: list[str] = None
 
 
-@dataclass
-class ConnectionCache:
-    """For holding AWS connections so they don't have to be reopened multiple times."""
-
-    aws_session: boto3.Session = None
-    dynamo_db_res: Any = None
-    dynamo_db_client: BaseClient = None
-    s3_client: BaseClient = None
-
-
-@dataclass
+@dataclass(slots=True)
 class ProfileCache:
     """For returning to a profile to where you left off."""
 
     last_realm: str = None
     realm_cache: dict[str, RealmCache] = field(default_factory=dict)
-    conn_cache: ConnectionCache = field(default_factory=ConnectionCache)
+
+
+# ------------------------------------------------------------------------------
+class DisplayTypeDeserializer(TypeDeserializer):
+    """
+    DynamoDB deserialiser for items that are only displayed.
+
+    Numbers are converted to int or float instead of Decimal, which is much
+    slower to create and needs special handling when converting to JSON. Don't
+    use this for anything that gets written back to DynamoDB.
+    """
+
+    # --------------------------------------------------------------------------
+    def _deserialize_n(self, value: str) -> int | float:
+        """Deserialise a DynamoDB number."""
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+
+
+# Converts items from the low level DynamoDB client to Python types for display.
+# The DynamoDB resource API does this too but creates a new deserialiser for
+# every call.
+deserialize = DisplayTypeDeserializer().deserialize
+
+
+# ------------------------------------------------------------------------------
+def make_aws_config() -> Config:
+    """Create the botocore config shared by all of our AWS clients."""
+
+    proxy = os.getenv('HTTPS_PROXY', GuiConfig().get('https_proxy', ''))
+    return Config(
+        proxies=({'http': proxy, 'https': proxy} if proxy else {}),
+        tcp_keepalive=True,
+        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+        connect_timeout=AWS_CONNECT_TIMEOUT,
+        read_timeout=AWS_READ_TIMEOUT,
+        retries=AWS_RETRIES,
+    )
+
+
+# ------------------------------------------------------------------------------
+# AWS sessions and clients are expensive to create so they are cached per profile
+# rather than recreated every time we switch back to a profile.
+@cache
+def get_aws_session(profile: str) -> boto3.Session:
+    """Get a boto3 session for the given profile."""
+
+    return boto3.Session(profile_name=profile)
+
+
+# ------------------------------------------------------------------------------
+@cache
+def get_aws_client(profile: str, service: str) -> BaseClient:
+    """Get a boto3 client for the given profile and service."""
+
+    return get_aws_session(profile).client(service, config=LavaAwsContext.aws_config)
+
+
+# ------------------------------------------------------------------------------
+@cache
+def get_aws_resource(profile: str, service: str) -> Any:
+    """Get a boto3 resource for the given profile and service."""
+
+    return get_aws_session(profile).resource(service, config=LavaAwsContext.aws_config)
+
+
+# ------------------------------------------------------------------------------
+@cache
+def get_dynamodb_table(profile: str, table_name: str) -> Any:
+    """Get a boto3 DynamoDB Table resource for the given profile."""
+
+    return get_aws_resource(profile, 'dynamodb').Table(table_name)
+
+
+# ------------------------------------------------------------------------------
+def clear_aws_cache():
+    """Discard all cached AWS sessions, clients and resources."""
+
+    get_aws_session.cache_clear()
+    get_aws_client.cache_clear()
+    get_aws_resource.cache_clear()
+    get_dynamodb_table.cache_clear()
+    check_aws_account_access.cache_clear()
+    _get_s3_text_version.cache_clear()
 
 
 # ------------------------------------------------------------------------------
 class LavaAwsContext:
     """
-    A Singleton class for managing AWS connection attributes within the application.
+    Class for managing AWS connection attributes within the application.
+
+    There is only one of these. Use `get_aws_context()` to get it.
 
     When a profile is updated, the old connection is closed, and a new one is initialized.
 
@@ -196,38 +402,27 @@ class LavaAwsContext:
 
     """
 
-    _instance = None
-
-    # --------------------------------------------------------------------------
-    def __new__(cls, *args, **kwargs):
-        """Enforce the Singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    aws_config: Config = make_aws_config()
 
     # --------------------------------------------------------------------------
     # TODO: There is a bunch of unused cruft in here.
     def __init__(self, profile: str = None):
         """Initialize the LavaAwsContext with an optional profile."""
-        if not hasattr(self, '_initialized') or not self._initialized:  # noqa
-            self.profile = profile
-            self.realm = None
-            self.run_id = None
-            self.job_id = None
-            self.job_list = []
-            self.events_list = []
-            self.current_job = None
-            self.aws_session = None
-            self.dynamo_db_client = None
-            self.dynamo_db_res = None
-            self.s3_client = None
-            self.globals = {}
-            self.old_file = None
-            self.params = {}
-            self._initialized = True
-            proxy = os.getenv('HTTPS_PROXY', GuiConfig().get('https_proxy', ''))
-            self.aws_config = Config(proxies=({'http': proxy, 'https': proxy} if proxy else {}))
-            self.profile_cache: dict[str, ProfileCache] = {}
+        self.profile = profile
+        self.realm = None
+        self.run_id = None
+        self.job_id = None
+        self.job_list = []
+        self.events_list = []
+        self.current_job = None
+        self.aws_session = None
+        self.dynamo_db_client = None
+        self.dynamo_db_res = None
+        self.s3_client = None
+        self.globals = {}
+        self.old_file = None
+        self.params = {}
+        self.profile_cache: dict[str, ProfileCache] = {}
 
         if profile:
             self.set_profile(profile)
@@ -235,43 +430,33 @@ class LavaAwsContext:
     # --------------------------------------------------------------------------
     def set_profile(self, profile):
         """
-        Update the AWS profile and initialize a new boto3 session.
+        Update the AWS profile and switch to the boto3 session for it.
 
-        Closes any existing session before creating a new one.
+        Sessions and clients are cached per profile so switching back to a
+        profile that has been used before doesn't recreate them.
         """
         if self.aws_session:
             self.close()  # Reset connections
 
-        try:
-            if profile not in self.profile_cache:
-                self.profile_cache[profile] = ProfileCache()
-
-            conn_cache = self.profile_cache[profile].conn_cache
+        if profile not in self.profile_cache:
+            self.profile_cache[profile] = ProfileCache()
 
-            self.aws_session = conn_cache.aws_session or boto3.Session(profile_name=profile)
-            self.dynamo_db_res = conn_cache.dynamo_db_res or self.aws_session.resource(
-                'dynamodb', config=self.aws_config
-            )
-            self.dynamo_db_client = conn_cache.dynamo_db_client or self.aws_session.client(
-                'dynamodb', config=self.aws_config
-            )
-            self.s3_client = conn_cache.s3_client or self.aws_session.client(
-                's3', config=self.aws_config
-            )
+        try:
+            self.aws_session = get_aws_session(profile)
+            self.dynamo_db_res = get_aws_resource(profile, 'dynamodb')
+            self.dynamo_db_client = get_aws_client(profile, 'dynamodb')
+            self.s3_client = get_aws_client(profile, 's3')
             check_aws_account_access(profile)
 
             self.profile = profile
-            conn_cache.aws_session = self.aws_session
-            conn_cache.dynamo_db_client = self.dynamo_db_client
-            conn_cache.dynamo_db_res = self.dynamo_db_res
-            conn_cache.s3_client = self.s3_client
             debug(f'Initialized AWS connection with profile: {profile}')
 
         except Exception as e:
             debug(f'Failed to initialize AWS connection for profile {profile}: {e}')
             self.close()
             self.profile = None
-            self.profile_cache[profile].conn_cache = ConnectionCache()
+            # Don't hang on to anything that may be holding bad credentials.
+            clear_aws_cache()
             raise e
 
     # --------------------------------------------------------------------------
@@ -303,95 +488,104 @@ class LavaAwsContext:
 
 
 # ------------------------------------------------------------------------------
+_io_executor = ThreadPoolExecutor(max_workers=AWS_IO_WORKERS, thread_name_prefix='aws-io')
+# Separate pool as S3 reads are themselves run in the I/O pool.
+_s3_read_executor = ThreadPoolExecutor(max_workers=S3_READ_WORKERS, thread_name_prefix='s3-read')
+# Separate pool as job list scans use the I/O pool for their segments.
+_preload_executor = ThreadPoolExecutor(max_workers=PRELOAD_WORKERS, thread_name_prefix='preload')
+# Preloaded job lists, keyed on (profile, realm), waiting to be picked up.
+_preloads: dict[tuple[str, str], Future] = {}
+_preloads_lock = threading.Lock()
+
+
+# ------------------------------------------------------------------------------
+async def run_io(func: Callable, /, *args, **kwargs) -> Any:
+    """
+    Run a blocking (typically AWS) call in the I/O worker pool.
+
+    :param func:    The function to call.
+    :param args:    Positional args for func.
+    :param kwargs:  Keyword args for func.
+
+    :return:        Whatever func returns.
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, partial(func, *args, **kwargs))
+
+
+# ------------------------------------------------------------------------------
+@cache
+def get_aws_context() -> LavaAwsContext:
+    """Get the application's AWS context."""
+
+    return LavaAwsContext()
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, eq=False)
 class GuiTheme:
-    """Class to create Themes."""
+    """
+    Class to create Themes.
 
-    # --------------------------------------------------------------------------
-    def __init__(
-        self,
-        name: str = None,
-        primary: str = '#FF5722',
-        secondary: str = '#03A9F4',
-        background: str = '#FFFFFF',
-        surface: str = '#000000',
-        error: str = '#F44336',
-        on_primary: str = '#FFFFFF',
-        on_secondary: str = '#000000',
-        on_background: str = '#000000',
-        on_surface: str = '#000000',
-        on_error: str = '#FFFFFF',
-        base_theme: ft.Theme = None,
-        visual_density: ft.VisualDensity = ft.VisualDensity.COMFORTABLE,
-        use_material3: bool = True,
-        font_family: str = None,
-        page_transitions=None,
-        data_table_theme: ft.DataTableTheme = None,
-        button_theme: ft.ButtonTheme = None,
-        text_theme: ft.TextTheme = None,
-        icon_theme: ft.IconTheme = None,
-        card_theme: ft.CardTheme = None,
-        dialog_theme: ft.DialogTheme = None,
-        markdown_code_theme: ft.MarkdownCodeTheme = None,
-        **additional_themes,
-    ):
-        """
-        Initialize a GuiTheme instance with options for a Flet theme.
-
-        Args:
-            name (str): The name of the theme.
-            primary (str): Primary color of the theme.
-            secondary (str): Secondary color of the theme.
-            background (str): Background color of the theme.
-            surface (str): Surface color of the theme.
-            error (str): Error color of the theme.
-            on_primary (str): Color for text/icons on primary color.
-            on_secondary (str): Color for text/icons on secondary color.
-            on_background (str): Color for text/icons on background.
-            on_surface (str): Color for text/icons on surface.
-            on_error (str): Color for text/icons on error color.
-            base_theme (ft.Theme): Theme class object that will be default for this GuiTheme.
-            visual_density (ft.VisualDensity): Density for visual components.
-            use_material3 (bool): Whether to use Material 3 design.
-            font_family (str): Font family for the theme.
-            page_transitions (ft.PageTransitionsTheme): Page transition theme.
-            data_table_theme (ft.DataTableTheme): DataTable specific theme.
-            button_theme (ft.ButtonTheme): Button specific theme.
-            text_theme (ft.TextTheme): Text specific theme.
-            icon_theme (ft.IconTheme): Icon specific theme.
-            card_theme (ft.CardTheme): Card specific theme.
-            dialog_theme (ft.DialogTheme): Dialog specific theme.
-            markdown_code_theme (ft.MarkdownCodeTheme): Markdown code specific theme.
-            additional_themes (dict): Additional theme options for components (e.g., sliders).
+    Instances are immutable. The Flet theme is built on first access to
+    `base_theme` and then reused.
 
-        """
-        self.name = name
-        self.primary = primary
-        self.secondary = secondary
-        self.background = background
-        self.surface = surface
-        self.error = error
-        self.on_primary = on_primary
-        self.on_secondary = on_secondary
-        self.on_background = on_background
-        self.on_surface = on_surface
-        self.on_error = on_error
-        self.base_theme = base_theme
-        self.visual_density = visual_density
-        self.use_material3 = use_material3
-        self.font_family = font_family
-        self.page_transitions = page_transitions
-        self.data_table_theme = data_table_theme
-        self.button_theme = button_theme
-        self.text_theme = text_theme
-        self.icon_theme = icon_theme
-        self.card_theme = card_theme
-        self.dialog_theme = dialog_theme
-        self.markdown_code_theme = markdown_code_theme
-        self.additional_themes = additional_themes
+    Attributes:
+        name (str): The name of the theme.
+        primary (str): Primary color of the theme.
+        secondary (str): Secondary color of the theme.
+        background (str): Background color of the theme.
+        surface (str): Surface color of the theme.
+        error (str): Error color of the theme.
+        on_primary (str): Color for text/icons on primary color.
+        on_secondary (str): Color for text/icons on secondary color.
+        on_background (str): Color for text/icons on background.
+        on_surface (str): Color for text/icons on surface.
+        on_error (str): Color for text/icons on error color.
+        visual_density (ft.VisualDensity): Density for visual components.
+        use_material3 (bool): Whether to use Material 3 design.
+        font_family (str): Font family for the theme.
+        page_transitions (ft.PageTransitionsTheme): Page transition theme.
+        data_table_theme (ft.DataTableTheme): DataTable specific theme.
+        button_theme (ft.ButtonTheme): Button specific theme.
+        text_theme (ft.TextTheme): Text specific theme.
+        icon_theme (ft.IconTheme): Icon specific theme.
+        card_theme (ft.CardTheme): Card specific theme.
+        dialog_theme (ft.DialogTheme): Dialog specific theme.
+        markdown_code_theme (ft.MarkdownCodeTheme): Markdown code specific theme.
+        additional_themes (dict): Additional theme options for components (e.g., sliders).
+
+    """
+
+    name: str = None
+    primary: str = '#FF5722'
+    secondary: str = '#03A9F4'
+    background: str = '#FFFFFF'
+    surface: str = '#000000'
+    error: str = '#F44336'
+    on_primary: str = '#FFFFFF'
+    on_secondary: str = '#000000'
+    on_background: str = '#000000'
+    on_surface: str = '#000000'
+    on_error: str = '#FFFFFF'
+    visual_density: ft.VisualDensity = ft.VisualDensity.COMFORTABLE
+    use_material3: bool = True
+    font_family: str = None
+    page_transitions: ft.PageTransitionsTheme = None
+    data_table_theme: ft.DataTableTheme = None
+    button_theme: ft.ButtonTheme = None
+    text_theme: ft.TextTheme = None
+    icon_theme: ft.IconTheme = None
+    card_theme: ft.CardTheme = None
+    dialog_theme: ft.DialogTheme = None
+    markdown_code_theme: ft.MarkdownCodeTheme = None
+    additional_themes: dict[str, Any] = field(default_factory=dict)
 
     # --------------------------------------------------------------------------
-    def update_theme(self):
-        """Add the Theme to GuiTheme object."""
+    @cached_property
+    def base_theme(self) -> ft.Theme:
+        """The Flet Theme for this GuiTheme."""
         color_scheme = ft.ColorScheme(
             primary=self.primary,
             secondary=self.secondary,
@@ -405,7 +599,7 @@ class GuiTheme:
             on_error=self.on_error,
         )
 
-        self.base_theme = ft.Theme(
+        return ft.Theme(
             color_scheme=color_scheme,
             visual_density=self.visual_density,
             use_material3=self.use_material3,
@@ -419,7 +613,6 @@ class GuiTheme:
             dialog_theme=self.dialog_theme,
             **self.additional_themes,  # Include additional themes for specific components
         )
-        GUI_THEMES[f'{self.name}'] = self
 
 
 # Don't be fooled by things like Flet's ElevatedButtonTheme. Useless.
@@ -445,7 +638,6 @@ light_theme_gui_theme = GuiTheme(
     on_background='#000000',
     markdown_code_theme=ft.MarkdownCodeTheme.ATOM_ONE_LIGHT,
 )
-light_theme_gui_theme.update_theme()
 
 dark_theme_gui_theme = GuiTheme(
     name='Dark Theme',
@@ -459,7 +651,10 @@ dark_theme_gui_theme = GuiTheme(
     on_background='yellow',
     markdown_code_theme=ft.MarkdownCodeTheme.ATOM_ONE_DARK,
 )
-dark_theme_gui_theme.update_theme()
+
+GUI_THEMES = MappingProxyType(
+    {theme.name: theme for theme in (light_theme_gui_theme, dark_theme_gui_theme)}
+)
 
 
 # ------------------------------------------------------------------------------
@@ -477,20 +672,81 @@ class LavaJobsPanel(ft.ListView):
         self.page = page
         self.on_job_click = on_job_click  # Store the callback for job selection
         self.original_job_list = []
+        # Case folded copy of original_job_list for searching
+        self._original_folded: list[str] = []
+        # The last search query and the indices of the jobs it matched
+        self._last_filter: tuple[str, list[int]] = ('', [])
+        # Displayed job list items keyed on job ID
+        self._by_id: dict[str, ft.Container] = {}
+        # All job list items built so far for the current job list, keyed on job ID.
+        # Filtering the list reuses these instead of building new ones.
+        self._items: dict[str, ft.Container] = {}
+        # Items with hover highlight changes not yet sent to the client.
+        self._pending_hover: set[ft.Control] = set()
+        self._hover_lock = threading.Lock()
+        self._hover_timer: threading.Timer | None = None
+        # Bind the fixed item attributes once rather than for every item.
+        self._make_item = partial(
+            ft.Container,
+            bgcolor=ft.Colors.SURFACE,
+            on_hover=self.on_hover,
+            on_click=self.on_select,
+        )
 
     # --------------------------------------------------------------------------
     def set_original_job_list(self, job_list: list[str]):
         """Update the original unfiltered job list."""
         self.original_job_list = job_list.copy()
+        self._original_folded = [job.casefold() for job in job_list]
+        self._last_filter = ('', [])
+        self._cancel_hover()
+        self._items = {}
+
+    # --------------------------------------------------------------------------
+    def filter_jobs(self, search_query: str) -> list[str]:
+        """
+        Get the jobs in the original job list that match a search query.
+
+        If the query contains the previous one (e.g. the user typed another
+        character), only the jobs that matched the previous query are checked.
+
+        :param search_query:    A case folded search string. Jobs containing this,
+                                ignoring case, are matched.
+        :return:                The matching jobs.
+        """
+
+        if not search_query:
+            return self.original_job_list
+
+        jobs_folded = self._original_folded
+        last_query, last_matches = self._last_filter
+        if last_query and last_query in search_query:
+            matches = [i for i in last_matches if search_query in jobs_folded[i]]
+        else:
+            matches = [i for i, job in enumerate(jobs_folded) if search_query in job]
+        self._last_filter = (search_query, matches)
+
+        jobs = self.original_job_list
+        return [jobs[i] for i in matches]
 
     # --------------------------------------------------------------------------
     def update_job_list(self, new_jobs: list):
         """Update the displayed job list and syncs the original job list."""
 
-        self.controls.clear()
-        for count, job in enumerate(new_jobs):
-            self.controls.append(self._job_item(job, count))
-
+        # Items are only built the first time a job is displayed. Build the new
+        # list in one go and then send a single update to the client.
+        self._cancel_hover()
+        items = self._items
+        make_item = self._make_item
+        selected = self.selected_job
+        for job in new_jobs:
+            if (item := items.get(job)) is None:
+                items[job] = make_item(JobListText(job), data=job)
+            else:
+                # A reused item may still have the highlight from its last hover.
+                item.bgcolor = ft.Colors.ON_SECONDARY if item is selected else ft.Colors.SURFACE
+        self._by_id = {job: items[job] for job in new_jobs}
+        self.controls[:] = self._by_id.values()
         self.page.update(self)
 
     # --------------------------------------------------------------------------
@@ -508,20 +764,17 @@ class LavaJobsPanel(ft.ListView):
 
         selected_job_control = None
         if selected_job_id is not None:
-            for control in self.controls:
-                if control.content and control.content.value == selected_job_id:
-                    selected_job_control = control
-                    break
+            selected_job_control = self._by_id.get(selected_job_id)
 
         if selected_job_control is None and e is None:
             return
 
         self.selected_job = selected_job_control or e.control
         self.selected_job.bgcolor = ft.Colors.ON_SECONDARY
+        # Both the old and new selections are in the list so one update does it.
         self.page.update(self)
-        self.selected_job.update()
 
-        current_connection = LavaAwsContext()
+        current_connection = get_aws_context()
 
         # Retrieve the selected job item and its data
         content = self.selected_job.content.value
@@ -532,32 +785,48 @@ class LavaJobsPanel(ft.ListView):
 
     # --------------------------------------------------------------------------
     def on_hover(self, e: ft.ControlEvent):
-        """Handle hover on/off over a job name in the job list."""
+        """
+        Handle hover on/off over a job name in the job list.
+
+        Moving the mouse over the list generates a stream of hover events so the
+        changes are batched up and sent to the client by a short timer.
+        """
 
-        with suppress(Exception):
-            colour = ft.Colors.ON_SECONDARY if e.control == self.selected_job else None
-            if colour is None:
-                colour = ft.Colors.SECONDARY if e.data == 'true' else None
-            e.control.bgcolor = colour
-            e.control.update()
+        colour = ft.Colors.ON_SECONDARY if e.control == self.selected_job else None
+        if colour is None:
+            colour = ft.Colors.SECONDARY if e.data == 'true' else None
+        e.control.bgcolor = colour
+        with self._hover_lock:
+            self._pending_hover.add(e.control)
+            if self._hover_timer is None:
+                self._hover_timer = threading.Timer(HOVER_UPDATE_DELAY, self._flush_hover)
+                self._hover_timer.daemon = True
+                self._hover_timer.start()
 
     # --------------------------------------------------------------------------
-    def _job_item(self, text, ind) -> ft.Container:
-        """
-        Create a widget for a job in the job list.
+    def _flush_hover(self):
+        """Send pending hover highlight changes to the client in one update."""
+
+        with self._hover_lock:
+            pending = self._pending_hover
+            self._pending_hover = set()
+            self._hover_timer = None
+        # Skip any items that have been removed from the page in the meantime.
+        if controls := [c for c in pending if c.page]:
+            try:
+                self.page.update(*controls)
+            except Exception as e:
+                debug(f'Could not send hover changes: {e}')
 
-        :param text:    Text of the item (job name)
-        :param ind:     Index.
-        :return:        The job name container.
-        """
+    # --------------------------------------------------------------------------
+    def _cancel_hover(self):
+        """Discard pending hover highlight changes when the list is rebuilt."""
 
-        return ft.Container(
-            JobListText(text),
-            bgcolor=ft.Colors.SURFACE,
-            data=(ind, (DetailText(text))),
-            on_hover=self.on_hover,
-            on_click=self.on_select,
-        )
+        with self._hover_lock:
+            if self._hover_timer is not None:
+                self._hover_timer.cancel()
+                self._hover_timer = None
+            self._pending_hover.clear()
 
 
 # ------------------------------------------------------------------------------
@@ -573,8 +842,8 @@ class SettingsDialog:
 
         self.theme_dropdown = ft.Dropdown(
             label='Select Theme',
-            label_style=DetailTextStyle(),
-            text_style=DetailTextStyle(),
+            label_style=DETAIL_STYLE,
+            text_style=DETAIL_STYLE,
             color=ft.Colors.PRIMARY,
             bgcolor=ft.Colors.SURFACE,
             options=[
@@ -592,7 +861,7 @@ class SettingsDialog:
 
         # Credit Box
         self.credit_box = ft.Container(
-            border=ft.border.all(1, color=BORDER_TRANSPARENT),
+            border=BORDER_INVISIBLE,
             bgcolor=ft.Colors.SURFACE,
             content=ft.Column(controls=[DetailTextBold(APP_INFO)]),
             height=75,
@@ -645,6 +914,16 @@ class JobLogsContent(ft.Column):
         self.current_run_id = None
         self.events_log_list = {}
         self.events_list: list[dict] = []
+        self.events_by_run_id: dict[str, dict] = {}
+        # Formatted event JSON keyed on run ID so it is only formatted once
+        self.event_json: dict[str, str] = {}
+        # Text shown in the log field without the markdown decoration
+        self.log_text = ''
+        # The run ID for which the log options dropdown was populated
+        self.log_options_run_id = None
+        # Identifies the last event fetch. See fetch_events().
+        self.last_fetch_key = None
+        self.last_fetch_time = datetime.min
         self.previous_selected_row_index = None
 
         self.data_row_height = GuiConfig().details_font_size + 6
@@ -660,8 +939,8 @@ class JobLogsContent(ft.Column):
             value=str(DEFAULT_EVENTS),
             width=110,
             expand=True,
-            text_style=DetailTextStyle(),
-            label_style=DetailTextStyle(),
+            text_style=DETAIL_STYLE,
+            label_style=DETAIL_STYLE,
         )
 
         # Fetch events button
@@ -690,8 +969,8 @@ class JobLogsContent(ft.Column):
             color=ft.Colors.PRIMARY,
             focused_border_color=ft.Colors.PRIMARY,
             options=[],
-            text_style=DetailTextStyle(),
-            label_style=DetailTextStyle(),
+            text_style=DETAIL_STYLE,
+            label_style=DETAIL_STYLE,
             on_change=self.handle_log_option_change,
             width=300,
             expand=True,
@@ -701,14 +980,14 @@ class JobLogsContent(ft.Column):
             selectable=True,
             extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
             code_theme=theme.color_scheme.on_surface,
-            code_style_sheet=ft.MarkdownStyleSheet(code_text_style=CodeTextStyle()),
+            code_style_sheet=ft.MarkdownStyleSheet(code_text_style=CODE_STYLE),
         )
 
         self.log_text_field_scrollable = ft.ListView(
             controls=[self.log_text_field],
             height=500,
             spacing=0,
-            padding=ft.padding.all(4),
+            padding=PADDING_4,
         )
 
         # Job logs table
@@ -732,17 +1011,17 @@ class JobLogsContent(ft.Column):
                             content=ft.Row(
                                 controls=[
                                     ft.Container(
-                                        content=self.max_events_dropdown, padding=ft.padding.all(4)
+                                        content=self.max_events_dropdown, padding=PADDING_4
                                     ),
                                     ft.Container(
-                                        content=self.fetch_events_button, padding=ft.padding.all(4)
+                                        content=self.fetch_events_button, padding=PADDING_4
                                     ),
                                     ft.Container(
                                         content=ft.Row(
                                             controls=[
                                                 ft.Container(
                                                     content=self.log_options_dropdown,
-                                                    padding=ft.padding.all(4),
+                                                    padding=PADDING_4,
                                                     expand=True,
                                                     width=300,
                                                 ),
@@ -767,11 +1046,11 @@ class JobLogsContent(ft.Column):
                                 scroll=ft.ScrollMode.ALWAYS,
                             ),
                             # Add padding around the logs table for better separation
-                            padding=ft.padding.all(10),
-                            border=ft.border.all(1, color=BORDER_TRANSPARENT),
+                            padding=PADDING_10,
+                            border=BORDER_INVISIBLE,
                             border_radius=8,
                             height=logs_table_height,
-                            margin=ft.margin.only(bottom=10),
+                            margin=MARGIN_BOTTOM_10,
                         ),
                         ft.Container(
                             content=ft.Column(
@@ -780,8 +1059,8 @@ class JobLogsContent(ft.Column):
                                     self.log_text_field_scrollable,
                                 ],
                             ),
-                            padding=ft.padding.all(10),  # Padding for visual separation
-                            border=ft.border.all(1, ft.Colors.PRIMARY),
+                            padding=PADDING_10,  # Padding for visual separation
+                            border=BORDER_PRIMARY,
                             border_radius=8,
                             expand=True,
                         ),
@@ -791,7 +1070,7 @@ class JobLogsContent(ft.Column):
                     horizontal_alignment=ft.CrossAxisAlignment.STRETCH,
                 ),
                 expand=True,  # Allow the container to expand and fit the available space
-                padding=ft.padding.all(10),
+                padding=PADDING_10,
             )
         ]
 
@@ -800,13 +1079,13 @@ class JobLogsContent(ft.Column):
         """Create a DataTable using the theme for styling."""
 
         return ft.DataTable(
-            data_text_style=DetailTextStyle(),
-            border=ft.border.all(1, ft.Colors.PRIMARY),
+            data_text_style=DETAIL_STYLE,
+            border=BORDER_PRIMARY,
             border_radius=5,
             horizontal_lines=ft.BorderSide(1, ft.Colors.PRIMARY),
             # hide internal column borders
             vertical_lines=ft.BorderSide(0, ft.Colors.TRANSPARENT),
-            show_checkbox_column=True,
+            show_checkbox_column=False,
             horizontal_margin=20,
             column_spacing=20,
             data_row_max_height=self.data_row_height,
@@ -814,30 +1093,18 @@ class JobLogsContent(ft.Column):
             heading_row_height=self.heading_row_height,
             columns=[
                 ft.DataColumn(
-                    ColumnHeadingText('Dispatch Time'),
-                    heading_row_alignment=ft.MainAxisAlignment.CENTER,
-                ),
-                ft.DataColumn(
-                    ColumnHeadingText('Event Time'),
-                    heading_row_alignment=ft.MainAxisAlignment.CENTER,
-                ),
-                ft.DataColumn(
-                    ColumnHeadingText('Elapsed'),
-                    heading_row_alignment=ft.MainAxisAlignment.CENTER,
-                ),
-                ft.DataColumn(
-                    ColumnHeadingText('Status'),
-                    heading_row_alignment=ft.MainAxisAlignment.CENTER,
-                ),
+                    ColumnHeadingText(heading), heading_row_alignment=ft.MainAxisAlignment.CENTER
+                )
+                for heading in ('Dispatch Time', 'Event Time', 'Elapsed', 'Status')
             ],
             rows=[],
         )
 
     # --------------------------------------------------------------------------
     # noinspection PyUnusedLocal
-    def fetch_events(self, e: ft.ControlEvent = None):
+    async def fetch_events(self, e: ft.ControlEvent = None):
         """Fetch events for the selected job and populate the DataTable."""
-        current_connection = LavaAwsContext()
+        current_connection = get_aws_context()
         job_id = current_connection.current_job
         max_events = int(self.max_events_dropdown.value)
 
@@ -850,69 +1117,118 @@ class JobLogsContent(ft.Column):
             show_error_popup(self.page, 'Realm not selected.')
             return
 
+        # If nothing has changed since the last fetch, what's displayed is current enough.
+        fetch_key = (current_connection.profile, realm, job_id, max_events)
+        now = datetime.now()
+        if fetch_key == self.last_fetch_key and now - self.last_fetch_time < EVENT_FETCH_REUSE:
+            return
+
+        # Let the user know something is happening while the query is in flight
+        self.fetch_events_button.disabled = True
+        self.fetch_events_button.text = 'Fetching ...'
+        self.fetch_events_button.update()
+
         try:
-            db_events_table = {
-                realm: current_connection.dynamo_db_res.Table(f'lava.{realm}.events')
-            }
-            self.events_list = get_events_for_job(
-                job_id=job_id,
-                events_table=db_events_table[realm],
-                limit=max_events,
+            events_list, events_log_list = await run_io(
+                self.fetch_events_work,
+                current_connection.profile,
+                realm,
+                job_id,
+                current_connection.dynamo_db_client,
+                max_events,
+            )
+
+            # The user may have moved on to another job while the query was in
+            # flight. If so, these events are not wanted.
+            current_key = (
+                current_connection.profile,
+                current_connection.realm,
+                current_connection.current_job,
+                int(self.max_events_dropdown.value),
             )
+            if current_key != fetch_key:
+                return
 
-            # Create log URIs for each run_id
-            self.events_log_list = get_event_logs_for_jobs(self.events_list)
+            self.events_list, self.events_log_list = events_list, events_log_list
+            self.events_by_run_id = {ev['run_id']: ev for ev in self.events_list}
+            self.event_json = {}
+            self.log_options_run_id = None
+            self.last_fetch_key, self.last_fetch_time = fetch_key, now
 
             # Update the DataTable with event data
-            self.job_logs_table.rows = [
-                ft.DataRow(
+            self.job_logs_table.rows = self.event_rows(self.events_list)
+            self.update()
+        except Exception as ex:
+            show_error_popup(self.page, f'An error occurred while fetching events: {ex}')
+        finally:
+            self.fetch_events_button.disabled = False
+            self.fetch_events_button.text = 'Fetch Events'
+            self.fetch_events_button.update()
+
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def fetch_events_work(
+        profile: str, realm: str, job_id: str, dynamo_db: BaseClient, max_events: int
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """
+        Get the events for a job and the log files they mention.
+
+        This does the blocking part of fetch_events and is run in the I/O pool.
+        If enabled, events are read from the local events cache if fresh enough.
+
+        :return:    A tuple (events, log files keyed on run ID).
+        """
+
+        cache_ttl = GuiConfig().events_cache_ttl
+        cache_path = events_cache_path(profile, realm, job_id, max_events)
+        events = load_cached_events(cache_path, cache_ttl) if cache_ttl > 0 else None
+        if events is None:
+            events = get_events_for_job(
+                job_id=job_id, realm=realm, dynamo_db=dynamo_db, limit=max_events
+            )
+            if cache_ttl > 0:
+                save_cached_events(cache_path, events)
+        return events, get_event_logs_for_jobs(events)
+
+    # --------------------------------------------------------------------------
+    def event_rows(self, events: list[dict[str, Any]]) -> list[ft.DataRow]:
+        """
+        Create the DataTable rows for a list of events.
+
+        :param events:  The events.
+        :return:        The DataTable rows. The row index is in each row's data.
+        """
+
+        # Bind these once as there are a lot of cells to make.
+        data_row, data_cell, text = ft.DataRow, ft.DataCell, DetailText
+        on_select = self.row_click_handler
+        center_right = ft.alignment.center_right
+        status_colour = EVENT_STATUS_COLOUR.get
+
+        # The click handler is on the row rather than on each cell.
+        rows = []
+        for index, event in enumerate(events):
+            ts_dispatch = event.get('ts_dispatch')
+            ts_event = event.get('ts_event')
+            status = event.get('status')
+            rows.append(
+                data_row(
                     cells=[
-                        ft.DataCell(
-                            ft.Container(
-                                content=DetailText(ev.get('ts_dispatch', '')),
-                                data=index,
-                                on_click=self.row_click_handler,
-                            ),
-                        ),
-                        ft.DataCell(
-                            ft.Container(
-                                content=DetailText(ev.get('ts_event', '')),
-                                data=index,
-                                on_click=self.row_click_handler,
-                            )
-                        ),
-                        ft.DataCell(
+                        data_cell(text(ts_dispatch or '')),
+                        data_cell(text(ts_event or '')),
+                        data_cell(
                             ft.Container(
-                                content=DetailText(
-                                    suppress_exception(
-                                        format_isodate_difference,
-                                        ev.get('ts_dispatch'),
-                                        ev.get('ts_event'),
-                                        exc_return='',
-                                    ),
-                                ),
-                                data=index,
-                                on_click=self.row_click_handler,
-                                alignment=ft.alignment.center_right,
+                                content=text(format_elapsed(ts_dispatch, ts_event)),
+                                alignment=center_right,
                             )
                         ),
-                        ft.DataCell(
-                            ft.Container(
-                                content=DetailText(
-                                    ev.get('status', ''),
-                                    color=EVENT_STATUS_COLOUR.get(ev.get('status')),
-                                ),
-                                data=index,
-                                on_click=self.row_click_handler,
-                            ),
-                        ),
+                        data_cell(text(status or '', color=status_colour(status))),
                     ],
+                    data=index,
+                    on_select_changed=on_select,
                 )
-                for index, ev in enumerate(self.events_list)
-            ]
-            self.update()
-        except Exception as ex:
-            show_error_popup(self.page, f'An error occurred while fetching events: {ex}')
+            )
+        return rows
 
     # --------------------------------------------------------------------------
     def row_click_handler(self, e: ft.ControlEvent):
@@ -920,41 +1236,58 @@ class JobLogsContent(ft.Column):
 
         row_index = e.control.data
         clicked_event = self.events_list[row_index]
-        self.current_run_id = clicked_event['run_id']
-
-        if self.previous_selected_row_index is None:
-            # Nothing clicked before so no need to change any colours back
-            # Change current to our Selected Colour then change previous to current clicked one
-            self.job_logs_table.rows[row_index].color = ft.Colors.ON_SECONDARY
-            self.previous_selected_row_index = row_index
-        else:
-            # This means something was selected prior so needs to change that one colour back to bg
-            # then change the new selected one to Selected Colour
-            # Then change previous selecte value to current clicked one
-            self.job_logs_table.rows[self.previous_selected_row_index].color = (
-                ft.ColorScheme.background
-            )
-            self.job_logs_table.rows[row_index].color = ft.Colors.ON_SECONDARY
-            self.previous_selected_row_index = row_index
-
-        # Populate the log dropdown
-        self.log_options_dropdown.options = [ft.dropdown.Option('Event Log')]
-        if self.current_run_id in self.events_log_list:
-            self.log_options_dropdown.options.extend(
-                [ft.dropdown.Option(log) for log in self.events_log_list[self.current_run_id]]
-            )
+        run_id = clicked_event['run_id']
+        rows = self.job_logs_table.rows
+
+        # Only the rows whose colour changes and the log controls are sent to the
+        # client, not the whole table.
+        changed = [rows[row_index], self.log_options_dropdown, self.log_text_field]
+        if self.previous_selected_row_index is not None:
+            # Something was selected previously so change its colour back
+            prev_row = rows[self.previous_selected_row_index]
+            prev_row.color = ft.ColorScheme.background
+            changed.append(prev_row)
+        rows[row_index].color = ft.Colors.ON_SECONDARY
+        self.previous_selected_row_index = row_index
+
+        # Populate the log dropdown unless it's already showing this run's logs
+        self.current_run_id = run_id
+        if run_id != self.log_options_run_id:
+            self.log_options_run_id = run_id
+            option = ft.dropdown.Option
+            self.log_options_dropdown.options = [
+                option('Event Log'),
+                *(option(log) for log in self.events_log_list.get(run_id, ())),
+            ]
 
-        event_spec = json.dumps(
-            clicked_event, indent=GuiConfig().json_indent, sort_keys=True, default=json_default
-        )
-        highlighted_event_spec = '```json\n' + event_spec
-        self.log_text_field.value = highlighted_event_spec
+        self.set_log_text(self.format_event(clicked_event))
         self.log_options_dropdown.value = 'Event Log'  # Reset dropdown selection
-        self.update()
+        self.page.update(*changed)
+
+    # --------------------------------------------------------------------------
+    def set_log_text(self, text: str):
+        """Display text in the log field. It gets highlighted as JSON."""
+
+        self.log_text = text
+        self.log_text_field.value = JSON_CODE_FENCE + text if text else ''
+
+    # --------------------------------------------------------------------------
+    def format_event(self, event: dict[str, Any]) -> str:
+        """Format an event as JSON for display, reusing earlier results."""
+
+        run_id = event.get('run_id')
+        try:
+            return self.event_json[run_id]
+        except KeyError:
+            pass
+        event_json = pretty_json(event)
+        if run_id:
+            self.event_json[run_id] = event_json
+        return event_json
 
     # --------------------------------------------------------------------------
     # noinspection PyUnusedLocal
-    def handle_log_option_change(self, e: ft.ControlEvent):
+    async def handle_log_option_change(self, e: ft.ControlEvent):
         """Handle log option change and display selected log."""
 
         selected_log = self.log_options_dropdown.value
@@ -964,12 +1297,8 @@ class JobLogsContent(ft.Column):
 
         if selected_log == 'Event Log':
             # Display event details
-            event = next((ev for ev in self.events_list if ev['run_id'] == self.current_run_id), {})
-            event_spec = json.dumps(
-                event, indent=GuiConfig().json_indent, sort_keys=True, default=json_default
-            )
-            highlighted_event_spec = '```json\n' + event_spec
-            self.log_text_field.value = highlighted_event_spec
+            event = self.events_by_run_id.get(self.current_run_id, {})
+            self.set_log_text(self.format_event(event))
 
         else:
             s3_uri = self.events_log_list[self.current_run_id].get(selected_log, '')
@@ -979,11 +1308,10 @@ class JobLogsContent(ft.Column):
 
             try:
                 bucket, s3_key = s3_split(s3_uri)
-                s3_client = LavaAwsContext().s3_client
-                data = s3_client.get_object(Bucket=bucket, Key=s3_key)
-                contents = data['Body'].read().decode('utf-8')
-                formatted_contents = '```json\n' + contents
-                self.log_text_field.value = formatted_contents
+                contents = await run_io(
+                    get_s3_text_cached, get_aws_context().s3_client, bucket, s3_key
+                )
+                self.set_log_text(contents)
 
             except Exception as ex:
                 show_error_popup(self.page, f'Failed to fetch log: {ex}')
@@ -996,11 +1324,7 @@ class JobLogsContent(ft.Column):
         """Download the contents of the log_text_field as a text file."""
         current_option = self.log_options_dropdown.value
         # Ensure there is content to download
-        if self.log_text_field.value is None:
-            show_error_popup(self.page, 'No log content. Please select a log.')
-            return
-
-        if not self.log_text_field.value.strip():
+        if not self.log_text.strip():
             show_error_popup(self.page, 'No log content to download. Please select a log.')
             return
 
@@ -1012,33 +1336,25 @@ class JobLogsContent(ft.Column):
             file_name = f"{current_option}-{self.current_run_id or 'unknown'}.txt"
             file_path = downloads_folder / file_name
 
-            # Clearing up our content format before downloading.
-            clean_content = re.sub(r'^```(?:json)?\n', '', self.log_text_field.value)
-
-            # If file does not exist in downloads, make a new file and write there
-            if not file_path.exists():
-                with open(file_path, 'w') as file:
-                    file.write(clean_content)
-                show_success_popup(self.page, f'Log saved to: {file_path}')
+            clean_content = self.log_text
 
-            # If file already exists, we need to know if the file is just alone or
-            # if there is a numbered version of it already
-            else:
+            # If the file already exists, add a number one more than the highest
+            # numbered version that's already there.
+            if file_path.exists():
                 base_name, ext = file_path.stem, file_path.suffix
-                max_number = 0
-
-                for existing_file in downloads_folder.glob(f'{base_name}_*{ext}'):
-                    if existing_file.stem.startswith(base_name):
-                        try:
-                            number = existing_file.stem[len(base_name) + 1 :]
-                            max_number = max(max_number, int(number))
-                        except ValueError:
-                            continue
-                new_file_name = f'{base_name}_{max_number + 1}{ext}'
-                new_file_path = downloads_folder / new_file_name
-                with open(new_file_path, 'w') as file:
-                    file.write(clean_content)
-                show_success_popup(self.page, f'log saved to: {new_file_path}')
+                numbered = re.compile(rf'{re.escape(base_name)}_(\d+){re.escape(ext)}')
+                max_number = max(
+                    (
+                        int(m.group(1))
+                        for existing_file in downloads_folder.iterdir()
+                        if (m := numbered.fullmatch(existing_file.name))
+                    ),
+                    default=0,
+                )
+                file_path = downloads_folder / f'{base_name}_{max_number + 1}{ext}'
+
+            file_path.write_text(clean_content)
+            show_success_popup(self.page, f'Log saved to: {file_path}')
 
         except Exception as ex:
             # Handle unexpected errors
@@ -1052,13 +1368,17 @@ class JobLogsContent(ft.Column):
         self.current_run_id = None
         self.events_log_list = {}
         self.events_list = []
+        self.events_by_run_id = {}
+        self.event_json = {}
+        self.log_options_run_id = None
+        self.last_fetch_key = None
 
         # Reset max events dropdown
         self.max_events_dropdown.value = DEFAULT_EVENTS
         self.log_options_dropdown.options = []
         self.log_options_dropdown.value = None
 
-        self.log_text_field.value = ''
+        self.set_log_text('')
 
         self.job_logs_table.rows = []
 
@@ -1081,8 +1401,8 @@ class JobDispatchContent(ft.Column):
         # Current job text field
         self.current_job_textfield = ft.TextField(
             label='Current Job',
-            text_style=DetailTextStyle(),
-            label_style=DetailTextBoldStyle(),
+            text_style=DETAIL_STYLE,
+            label_style=DETAIL_BOLD_STYLE,
             read_only=True,
             border_color=ft.Colors.PRIMARY,
             width=500,
@@ -1091,8 +1411,8 @@ class JobDispatchContent(ft.Column):
         # Job worker text field
         self.job_worker_textfield = ft.TextField(
             label='Worker',
-            text_style=DetailTextStyle(),
-            label_style=DetailTextBoldStyle(),
+            text_style=DETAIL_STYLE,
+            label_style=DETAIL_BOLD_STYLE,
             read_only=True,
             border_color=ft.Colors.PRIMARY,
             width=TEXTFIELD_WIDTH_SIZE_WORKER,
@@ -1101,8 +1421,8 @@ class JobDispatchContent(ft.Column):
         # Dispatch job Run ID text field
         self.dispatch_job_run_id_textfield = ft.TextField(
             label='Dispatch Job Run ID',
-            text_style=DetailTextStyle(),
-            label_style=DetailTextBoldStyle(),
+            text_style=DETAIL_STYLE,
+            label_style=DETAIL_BOLD_STYLE,
             read_only=True,
             border_color=ft.Colors.PRIMARY,
             width=250,
@@ -1130,8 +1450,8 @@ class JobDispatchContent(ft.Column):
         self.status_icon = ft.TextField(
             value='Status',
             color=ft.Colors.PRIMARY,
-            text_style=DetailTextStyle(),
-            label_style=DetailTextBoldStyle(),
+            text_style=DETAIL_STYLE,
+            label_style=DETAIL_BOLD_STYLE,
             width=120,
             text_align=ft.TextAlign.CENTER,
             border_color=ft.Colors.PRIMARY,
@@ -1140,11 +1460,15 @@ class JobDispatchContent(ft.Column):
             read_only=True,
         )
 
+        # Rows for the globals / parameters tables are kept for reuse across jobs.
+        self.args_rows_pool: list[ft.DataRow] = []
+        self.params_rows_pool: list[ft.DataRow] = []
+
         # Globals table
         self.args_table = ft.DataTable(
             data_row_min_height=details_font_size + 6,
             heading_row_height=heading_font_size + 6,
-            border=ft.border.all(1, ft.Colors.PRIMARY),
+            border=BORDER_PRIMARY,
             border_radius=5,
             vertical_lines=ft.BorderSide(1, ft.Colors.PRIMARY),
             horizontal_lines=ft.BorderSide(1, ft.Colors.PRIMARY),
@@ -1193,7 +1517,7 @@ class JobDispatchContent(ft.Column):
         self.params_table = ft.DataTable(
             data_row_min_height=details_font_size + 6,
             heading_row_height=heading_font_size + 6,
-            border=ft.border.all(1, ft.Colors.PRIMARY),
+            border=BORDER_PRIMARY,
             border_radius=5,
             vertical_lines=ft.BorderSide(1, ft.Colors.PRIMARY),
             horizontal_lines=ft.BorderSide(1, ft.Colors.PRIMARY),
@@ -1230,7 +1554,7 @@ class JobDispatchContent(ft.Column):
             height=500,
             expand=False,
             spacing=0,
-            padding=ft.padding.all(4),
+            padding=PADDING_4,
         )
 
         self.latest_dispatch_time = datetime.fromtimestamp(0)
@@ -1238,6 +1562,8 @@ class JobDispatchContent(ft.Column):
 
         self.original_globals_data = None
         self.original_params_data = None
+        # The job details the panel was last populated from
+        self.job_details: JobDetails | None = None
         # Assemble controls
         expander_icon_name = GuiConfig().expander_icon
         if not hasattr(ft.Icons, expander_icon_name):
@@ -1258,7 +1584,7 @@ class JobDispatchContent(ft.Column):
                                 spacing=10,
                                 alignment=ft.MainAxisAlignment.START,
                             ),
-                            margin=ft.margin.only(bottom=20),  # Add some margin for separation
+                            margin=MARGIN_BOTTOM_20,  # Add some margin for separation
                         ),
                         # Globals section with table and buttons
                         ft.ExpansionTile(
@@ -1271,7 +1597,7 @@ class JobDispatchContent(ft.Column):
                             collapsed_icon_color=ft.Colors.PRIMARY,
                             controls=[
                                 ft.Container(
-                                    padding=ft.Padding(0, 0, 0, 0),
+                                    padding=PADDING_NONE,
                                     content=ft.Column(
                                         controls=[
                                             ft.Row(
@@ -1285,7 +1611,7 @@ class JobDispatchContent(ft.Column):
                                             self.args_table,
                                         ],
                                     ),
-                                    margin=ft.margin.only(bottom=20),
+                                    margin=MARGIN_BOTTOM_20,
                                 ),
                             ],
                         ),
@@ -1300,7 +1626,7 @@ class JobDispatchContent(ft.Column):
                             collapsed_icon_color=ft.Colors.PRIMARY,
                             controls=[
                                 ft.Container(
-                                    padding=ft.Padding(0, 0, 0, 0),
+                                    padding=PADDING_NONE,
                                     content=ft.Column(
                                         controls=[
                                             ft.Row(
@@ -1314,7 +1640,7 @@ class JobDispatchContent(ft.Column):
                                             self.params_table,
                                         ],
                                     ),
-                                    margin=ft.margin.only(bottom=20),
+                                    margin=MARGIN_BOTTOM_20,
                                 ),
                             ],
                         ),
@@ -1340,8 +1666,8 @@ class JobDispatchContent(ft.Column):
                                                 self.dispatch_job_details_markdown_scrollable,
                                             ],
                                         ),
-                                        padding=ft.padding.all(10),  # Padding for visual separation
-                                        border=ft.border.all(1, ft.Colors.PRIMARY),
+                                        padding=PADDING_10,  # Padding for visual separation
+                                        border=BORDER_PRIMARY,
                                         border_radius=8,
                                         expand=True,
                                     ),
@@ -1351,7 +1677,7 @@ class JobDispatchContent(ft.Column):
                                 horizontal_alignment=ft.CrossAxisAlignment.STRETCH,
                             ),
                             expand=True,
-                            margin=ft.margin.only(bottom=20),
+                            margin=MARGIN_BOTTOM_20,
                         ),
                     ],
                     scroll=ft.ScrollMode.ALWAYS,
@@ -1359,7 +1685,7 @@ class JobDispatchContent(ft.Column):
                     horizontal_alignment=ft.CrossAxisAlignment.STRETCH,
                 ),
                 expand=True,
-                padding=ft.padding.all(10),
+                padding=PADDING_10,
             )
         ]
 
@@ -1384,7 +1710,7 @@ class JobDispatchContent(ft.Column):
     def handle_dispatch_job_click(self, e: ft.ControlEvent) -> None:
         """Handle dispatching the job with the provided parameters and globals."""
 
-        current_connection = LavaAwsContext()
+        current_connection = get_aws_context()
         try:
             # Get current job ID and worker
             job_id = self.current_job_textfield.value.strip()
@@ -1411,55 +1737,15 @@ class JobDispatchContent(ft.Column):
                 )
                 return
 
-            # Extract global variables
-            globals_ = {}
-            if self.args_table.rows:
-                globals_ = {
-                    row.cells[0].content.value: row.cells[1].content.value
-                    for row in self.args_table.rows
-                }
-
-            if globals_:
-                for key in globals_:
-                    value = globals_[key]
-                    try:
-                        new_value = json.loads(value)
-                        globals_[key] = new_value
-                    except json.decoder.JSONDecodeError as e:  # noqa
-                        if value.lower() == 'true':
-                            value = True
-                        elif value.lower() == 'false':
-                            value = False
-                        elif value.lower() == 'none':
-                            value = None
-                        elif value.strip().lstrip('-').replace('.', '', 1).isdigit():
-                            value = decimal.Decimal(value)
-                        globals_[key] = value
-
-            # Extract parameters
-            params = {}
-            if self.params_table.rows:
-                params = {
-                    row.cells[0].content.value: row.cells[1].content.value
-                    for row in self.params_table.rows
-                }
-
-            if params:
-                for key in params:
-                    value = params[key]
-                    try:
-                        new_value = json.loads(value)
-                        params[key] = new_value
-                    except json.decoder.JSONDecodeError as e:  # noqa
-                        if value.lower() == 'true':
-                            value = True
-                        elif value.lower() == 'false':
-                            value = False
-                        elif value.lower() == 'none':
-                            value = None
-                        elif value.strip().lstrip('-').replace('.', '', 1).isdigit():
-                            value = decimal.Decimal(value)
-                        params[key] = value
+            # Extract global variables and parameters
+            globals_ = {
+                row.cells[0].content.value: parse_dispatch_value(row.cells[1].content.value)
+                for row in self.args_table.rows or ()
+            }
+            params = {
+                row.cells[0].content.value: parse_dispatch_value(row.cells[1].content.value)
+                for row in self.params_table.rows or ()
+            }
 
             run_id = dispatch(
                 realm=current_connection.realm,
@@ -1485,7 +1771,7 @@ class JobDispatchContent(ft.Column):
     def handle_fetch_log_details_click(self, e: ft.ControlEvent):
         """Handle fetching the logs details from the logs table."""
 
-        current_connection = LavaAwsContext()
+        current_connection = get_aws_context()
         realm = current_connection.realm
         job_id = self.current_job_textfield.value.strip()
         run_id = self.dispatch_job_run_id_textfield.value.strip()
@@ -1512,25 +1798,29 @@ class JobDispatchContent(ft.Column):
             )
             return
 
-        db_events_table = {realm: current_connection.dynamo_db_res.Table(f'lava.{realm}.events')}
-
+        # Look for the run in the job's recent events. If it's not there it may not
+        # exist or the user can check in job logs for more details.
         events_list = get_events_for_job(
-            job_id=job_id, events_table=db_events_table[realm], limit=10
+            job_id=job_id,
+            realm=realm,
+            dynamo_db=current_connection.dynamo_db_client,
+            limit=10,
+            run_id=run_id,
         )
-        # Use the events_list to find the job that has run_id here, shows an error
-        # if job is not found that it may not exist or to check in job logs for more details
-        for event in events_list:
-            if event['run_id'] == run_id:  # which means this run exists
-                current_status = event['status']
-                debug(current_status)
-                event_spec = json.dumps(
-                    event, indent=GuiConfig().json_indent, sort_keys=True, default=json_default
-                )
-                highlighted_event_spec = '```json\n' + event_spec
-                self.dispatch_job_log_details_markdown.value = highlighted_event_spec
-                self.check_status(current_status)
-                self.update()
-                continue  # leave loop early if we found the run we seek
+        if events_list:
+            event = events_list[0]
+            current_status = event['status']
+            debug(current_status)
+            self.dispatch_job_log_details_markdown.value = JSON_CODE_FENCE + pretty_json(event)
+            self.check_status(current_status)
+            # Only these two have changed so no need to diff the whole panel.
+            self.page.update(self.dispatch_job_log_details_markdown, self.status_icon)
+        else:
+            show_error_popup(
+                self.page,
+                f'No recent event found for run {run_id}. It may not have started yet'
+                ' or may be older. Check the job logs tab for more details.',
+            )
 
         self.latest_fetch_time = now
 
@@ -1545,32 +1835,10 @@ class JobDispatchContent(ft.Column):
     def add_globals_row(self, e: ft.ControlEvent):
         """Add a new editable row to the globals table."""
 
-        details_font_size = GuiConfig().details_font_size
         new_row = ft.DataRow(
             cells=[
-                ft.DataCell(
-                    ft.TextField(
-                        border_color=BORDER_TRANSPARENT,
-                        height=18,
-                        text_size=details_font_size,
-                        color=ft.Colors.PRIMARY,
-                        multiline=True,
-                        content_padding=DATA_CELL_INNER_TEXTBOX_PADDING,
-                        text_align=ft.TextAlign.LEFT,
-                    ),
-                ),
-                ft.DataCell(
-                    ft.TextField(
-                        width=300,
-                        height=18,
-                        content_padding=DATA_CELL_INNER_TEXTBOX_PADDING,
-                        border_color=BORDER_TRANSPARENT,
-                        text_size=details_font_size,
-                        text_align=ft.TextAlign.LEFT,
-                        color=ft.Colors.PRIMARY,
-                        multiline=True,
-                    )
-                ),
+                ft.DataCell(NewDataCellTextField()),
+                ft.DataCell(NewDataCellTextField(width=300)),
             ],
         )
         self.args_table.rows.append(new_row)
@@ -1580,31 +1848,10 @@ class JobDispatchContent(ft.Column):
     # noinspection PyUnusedLocal
     def add_params_row(self, e: ft.ControlEvent):
         """Add a new editable row to the parameters table."""
-        details_font_size = GuiConfig().details_font_size
         new_row = ft.DataRow(
             cells=[
-                ft.DataCell(
-                    ft.TextField(
-                        border_color=BORDER_TRANSPARENT,
-                        height=18,
-                        text_size=details_font_size,
-                        color=ft.Colors.PRIMARY,
-                        multiline=True,
-                        content_padding=DATA_CELL_INNER_TEXTBOX_PADDING,
-                        text_align=ft.TextAlign.LEFT,
-                    )
-                ),
-                ft.DataCell(
-                    ft.TextField(
-                        border_color=BORDER_TRANSPARENT,
-                        height=18,
-                        text_size=details_font_size,
-                        color=ft.Colors.PRIMARY,
-                        multiline=True,
-                        content_padding=DATA_CELL_INNER_TEXTBOX_PADDING,
-                        text_align=ft.TextAlign.LEFT,
-                    )
-                ),
+                ft.DataCell(NewDataCellTextField()),
+                ft.DataCell(NewDataCellTextField()),
             ]
         )
         self.params_table.rows.append(new_row)
@@ -1615,79 +1862,62 @@ class JobDispatchContent(ft.Column):
     def process_extra_params(extra_params: str) -> dict[str, Any]:
         """Process extra parameters from the text field."""
         params = {}
-        for line in extra_params.split('\n'):
-            if '==' in line:
-                key, value = line.split('==', 1)
+        for line in extra_params.splitlines():
+            key, sep, value = line.partition('==')
+            if sep:
                 params[key.strip()] = value.strip()
         return params
 
     # --------------------------------------------------------------------------
-    def populate_tables(self, globals_data: dict[str, Any], params_data: dict[str, Any]):
-        """Populate the DataTables with global and parameter data."""
+    @staticmethod
+    def fill_value_rows(pool: list[ft.DataRow], data: dict[str, Any]) -> list[ft.DataRow]:
+        """
+        Get globals / parameters table rows showing the given data.
 
-        self.globals_expansion_icon.color = (
-            ft.Colors.SECONDARY if globals_data else ft.Colors.PRIMARY
-        )
-        self.parameters_expansion_icon.color = (
-            ft.Colors.SECONDARY if params_data else ft.Colors.PRIMARY
-        )
+        Rows are reused from the pool where possible rather than created for each
+        job. New rows are added to the pool.
 
-        self.args_table.rows = [
-            ft.DataRow(
-                cells=[
-                    ft.DataCell(
-                        ft.TextField(
-                            value=str(key),
-                            text_style=DetailTextStyle(),
-                            multiline=True,
-                            max_lines=2,
-                            border_color=BORDER_TRANSPARENT,
-                            content_padding=DATA_CELL_INNER_TEXTBOX_PADDING,
-                        )
-                    ),
-                    ft.DataCell(
-                        ft.TextField(
-                            value=json.dumps(value) if type(value) in (list, dict) else str(value),
-                            text_style=DetailTextStyle(),
-                            multiline=True,
-                            max_lines=2,
-                            border_color=BORDER_TRANSPARENT,
-                            content_padding=DATA_CELL_INNER_TEXTBOX_PADDING,
-                        )
-                    ),
-                ]
-            )
-            for key, value in globals_data.items()
-        ]
+        :param pool:    Previously created rows.
+        :param data:    A dict of globals or parameters.
+        :return:        The rows to display.
+        """
 
-        self.params_table.rows = [
-            ft.DataRow(
-                cells=[
-                    ft.DataCell(
-                        ft.TextField(
-                            value=str(key),
-                            text_style=DetailTextStyle(),
-                            multiline=True,
-                            max_lines=2,  # Set maximum visible lines before scrolling
-                            border_color=BORDER_TRANSPARENT,
-                            content_padding=DATA_CELL_INNER_TEXTBOX_PADDING,
-                        )
-                    ),
-                    ft.DataCell(
-                        ft.TextField(
-                            value=json.dumps(value) if type(value) in (list, dict) else str(value),
-                            text_style=DetailTextStyle(),
-                            multiline=True,
-                            max_lines=2,  # Set maximum visible lines before scrolling
-                            border_color=BORDER_TRANSPARENT,
-                            content_padding=DATA_CELL_INNER_TEXTBOX_PADDING,
-                        )
-                    ),
-                ]
+        for i, (key, value) in enumerate(data.items()):
+            if i < len(pool):
+                key_cell, value_cell = pool[i].cells
+                key_cell.content.value = str(key)
+                value_cell.content.value = format_dispatch_value(value)
+                continue
+            pool.append(
+                ft.DataRow(
+                    cells=[
+                        # Set maximum visible lines before scrolling
+                        ft.DataCell(DataCellTextField(value=str(key), max_lines=2)),
+                        ft.DataCell(
+                            DataCellTextField(value=format_dispatch_value(value), max_lines=2)
+                        ),
+                    ]
+                )
             )
-            for key, value in params_data.items()
-        ]
-        self.update()
+        return pool[: len(data)]
+
+    # --------------------------------------------------------------------------
+    def populate_tables(self, globals_data: dict[str, Any], params_data: dict[str, Any]):
+        """
+        Populate the DataTables with global and parameter data.
+
+        This doesn't update the control. That's left to the caller.
+        """
+
+        self.globals_expansion_icon.color = (
+            ft.Colors.SECONDARY if globals_data else ft.Colors.PRIMARY
+        )
+        self.parameters_expansion_icon.color = (
+            ft.Colors.SECONDARY if params_data else ft.Colors.PRIMARY
+        )
+
+        self.args_table.rows = self.fill_value_rows(self.args_rows_pool, globals_data)
+        self.params_table.rows = self.fill_value_rows(self.params_rows_pool, params_data)
 
 
 # ------------------------------------------------------------------------------
@@ -1719,8 +1949,8 @@ class JobsRunning(ft.Column):
         )
 
         self.jobs_table = ft.DataTable(
-            data_text_style=DetailTextStyle(),
-            border=ft.border.all(1, ft.Colors.PRIMARY),
+            data_text_style=DETAIL_STYLE,
+            border=BORDER_PRIMARY,
             border_radius=5,
             vertical_lines=ft.BorderSide(1, ft.Colors.PRIMARY),
             show_checkbox_column=True,
@@ -1745,7 +1975,7 @@ class JobsRunning(ft.Column):
             content=ft.Row(
                 controls=[self.fetch_jobs_button], alignment=ft.MainAxisAlignment.CENTER
             ),
-            padding=ft.padding.all(10),
+            padding=PADDING_10,
         )
 
         # Layout
@@ -1765,17 +1995,17 @@ class JobsRunning(ft.Column):
                     scroll=ft.ScrollMode.ALWAYS,
                 ),
                 # Add padding around the logs table for better separation
-                padding=ft.padding.all(10),
-                border=ft.border.all(1, color=BORDER_TRANSPARENT),
+                padding=PADDING_10,
+                border=BORDER_INVISIBLE,
                 border_radius=8,
                 height=248,
-                margin=ft.margin.only(bottom=10),  # size of split between this and container below
+                margin=MARGIN_BOTTOM_10,  # size of split between this and container below
             ),
         ]
 
     # --------------------------------------------------------------------------
     # noinspection PyUnusedLocal
-    def display_running_jobs(self, e: ft.ControlEvent):
+    async def display_running_jobs(self, e: ft.ControlEvent):
         """Fetch and display currently running jobs."""
 
         if self.scan_in_progress:
@@ -1805,16 +2035,14 @@ class JobsRunning(ft.Column):
             self.jobs_table.rows.clear()
             self.update()
 
-            running_jobs = self.get_currently_running_jobs()
+            # The scan itself runs its segments in the I/O pool so this can't go there.
+            running_jobs = await asyncio.to_thread(self.get_currently_running_jobs)
 
             if not running_jobs:
                 self.controls[2].content.controls[0].value = 'No running jobs found'
-                self.jobs_table.rows.clear()
-                self.update()
             else:
                 # Populate the ListView with running jobs
                 self.controls[2].content.controls[0].value = 'Currently running jobs'
-                self.update()
                 self.jobs_table.rows = [
                     ft.DataRow(
                         cells=[
@@ -1824,14 +2052,12 @@ class JobsRunning(ft.Column):
                     )
                     for item in running_jobs
                 ]
-                self.update()
 
-            self.scan_in_progress = False
-            self.jobs_table.update()
+            self.update()
         except Exception as e:  # noqa
             show_error_popup(self.page, f'There was an error fetching running jobs: {e}')
-            self.scan_in_progress = False
         finally:
+            self.scan_in_progress = False
             self.latest_scan_time = now
 
     # --------------------------------------------------------------------------
@@ -1839,6 +2065,9 @@ class JobsRunning(ft.Column):
         """
         Identify jobs in a running state that started within the last 12 hours.
 
+        This blocks on a DynamoDB scan so don't call it in the UI thread. Errors
+        are left to the caller.
+
         Returns:
         - List of tuples (job ID, run ID) for jobs currently running.
 
@@ -1846,71 +2075,50 @@ class JobsRunning(ft.Column):
         end_time = datetime.now().astimezone()
         start_time = end_time - timedelta(hours=RUNNING_JOB_LOOKBACK_HOURS)
 
-        # AWS connection and DynamoDB setup
         realm = self.lava_aws_context.realm
-        dynamo_db = self.lava_aws_context.dynamo_db_res
-        table_name = f'lava.{realm}.events'
-        table = dynamo_db.Table(table_name)
+        dynamo_db = self.lava_aws_context.dynamo_db_client
 
         # ISO format times for query
         start_iso = start_time.isoformat()
         end_iso = end_time.isoformat()
 
-        currently_running_jobs = []
-
-        try:
-            # Scan for items where the status is "running" within the last 12 hours
-            items = []
-            response = table.scan(
-                ProjectionExpression='job_id , run_id , ts_dispatch, #status',
-                FilterExpression=(
-                    '#status = :running_status AND ts_dispatch BETWEEN :start_ts AND :end_ts'
-                ),
-                ExpressionAttributeNames={'#status': 'status'},  # Alias for reserved keyword
-                ExpressionAttributeValues={
-                    ':running_status': 'running',
-                    ':start_ts': start_iso,
-                    ':end_ts': end_iso,
-                },
-                TotalSegments=4,
-                Segment=3,
-            )
-            items += response.get('Items', [])
-            while 'LastEvaluatedKey' in response:
-                response = table.scan(
-                    ProjectionExpression='job_id , run_id , ts_dispatch, #status',
-                    FilterExpression=(
-                        '#status = :running_status AND ts_dispatch BETWEEN :start_ts AND :end_ts'
-                    ),
-                    ExpressionAttributeNames={'#status': 'status'},  # Alias for reserved keyword
-                    ExpressionAttributeValues={
-                        ':running_status': 'running',
-                        ':start_ts': start_iso,
-                        ':end_ts': end_iso,
-                    },
-                    ExclusiveStartKey=response['LastEvaluatedKey'],
-                    TotalSegments=4,
-                    Segment=3,
-                )
-                items += response.get('Items', [])
+        # Scan for items where the status is "running" within the last 12 hours
+        items = scan_table(
+            dynamo_db,
+            TableName=f'lava.{realm}.events',
+            # Filter attributes don't need to be projected
+            ProjectionExpression='job_id, run_id',
+            FilterExpression=(
+                '#status = :running_status AND ts_dispatch BETWEEN :start_ts AND :end_ts'
+            ),
+            ExpressionAttributeNames={'#status': 'status'},  # Alias for reserved keyword
+            ExpressionAttributeValues={
+                ':running_status': {'S': 'running'},
+                ':start_ts': {'S': start_iso},
+                ':end_ts': {'S': end_iso},
+            },
+        )
 
-            for item in items:
-                job_id = item.get('job_id')
-                run_id = item.get('run_id')
-                currently_running_jobs.append((job_id, run_id))
-            return currently_running_jobs
-        except Exception as e:
-            show_error_popup(self.page, f'There was an error fetching running jobs: {e}')
-            return []
+        return [(item.get('job_id'), item.get('run_id')) for item in items]
 
 
 # ------------------------------------------------------------------------------
-def show_error_popup(page: ft.Page, message: str, title: str = 'Error'):
-    """Display an error popup with the given message."""
+@cache
+def get_popup_dialog(page: ft.Page, kind: str) -> ft.AlertDialog:
+    """
+    Get the popup dialog of the given kind for a page.
+
+    Dialogs are built once and then reused for each message.
+
+    :param page:    The page.
+    :param kind:    Popup kind (e.g. 'error'). Each kind gets its own dialog.
+    :return:        The dialog.
+    """
+
     dlg = ft.AlertDialog(
         modal=False,
-        title=ft.Text(title),
-        content=ft.Text(message, selectable=True),
+        title=ft.Text(),
+        content=ft.Text(selectable=True),
         actions=[
             ft.Button(
                 text='OK',
@@ -1921,103 +2129,362 @@ def show_error_popup(page: ft.Page, message: str, title: str = 'Error'):
         ],
         actions_alignment=ft.MainAxisAlignment.END,
     )
+    return dlg
+
+
+# ------------------------------------------------------------------------------
+def show_popup(page: ft.Page, kind: str, message: str, title: str):
+    """Display a popup of the given kind with the given message."""
+
+    dlg = get_popup_dialog(page, kind)
+    dlg.title.value = title
+    dlg.content.value = message
     page.open(dlg)
 
 
+# ------------------------------------------------------------------------------
+def show_error_popup(page: ft.Page, message: str, title: str = 'Error'):
+    """Display an error popup with the given message."""
+
+    show_popup(page, 'error', message, title)
+
+
 # ------------------------------------------------------------------------------
 def show_success_popup(page: ft.Page, message: str, title: str = 'Success'):
     """Display a success popup with the given message."""
-    dlg = ft.AlertDialog(
-        modal=False,
-        title=ft.Text(title),
-        content=ft.Text(message, selectable=True),
-        actions=[
-            ft.Button(
-                text='OK',
-                color=blue_button_style.highlight_color,
-                bgcolor=blue_button_style.button_color,
-                on_click=lambda e: page.close(dlg),
-            )
-        ],
-        actions_alignment=ft.MainAxisAlignment.END,
-    )
-    page.open(dlg)
+
+    show_popup(page, 'success', message, title)
 
 
 # ------------------------------------------------------------------------------
 def get_events_for_job(
-    job_id: str, events_table, limit: int = DEFAULT_EVENTS, status: str | None = None
+    job_id: str,
+    realm: str,
+    dynamo_db: BaseClient,
+    limit: int = DEFAULT_EVENTS,
+    status: str | None = None,
+    run_id: str | None = None,
 ) -> list[dict[str, Any]]:
     """
     Retrieve event data for the specified job_id.
 
+    Note that the status and run_id filters are applied by DynamoDB after the
+    limit, so they select from the most recent `limit` events.
+
     :param job_id:          Job identifier
-    :param events_table:    DynamoDB events table .
+    :param realm:           Lava realm.
+    :param dynamo_db:       DynamoDB client.
     :param limit:           Maximum number of events to fetch.
     :param status:          If not None, only get events with the given status.
+    :param run_id:          If not None, only get events with the given run ID.
 
     :return:                A list of events.
     """
 
     query_args = {
+        'TableName': f'lava.{realm}.events',
         'IndexName': 'job_id-tu_event-index',
         'KeyConditionExpression': '#job_id = :job_id',
         'ExpressionAttributeNames': {'#job_id': 'job_id'},
-        'ExpressionAttributeValues': {':job_id': job_id},
+        'ExpressionAttributeValues': {':job_id': {'S': job_id}},
         'ScanIndexForward': False,
     }
 
     if limit and limit > 0:
         query_args['Limit'] = min(limit, MAX_EVENTS)
 
+    filters = []
     if status:
-        query_args['FilterExpression'] = '#status = :status'
+        filters.append('#status = :status')
         query_args['ExpressionAttributeNames']['#status'] = 'status'
-        # noinspection PyTypeChecker
         query_args['ExpressionAttributeValues'][':status'] = {'S': status}
+    if run_id:
+        filters.append('#run_id = :run_id')
+        query_args['ExpressionAttributeNames']['#run_id'] = 'run_id'
+        query_args['ExpressionAttributeValues'][':run_id'] = {'S': run_id}
+    if filters:
+        query_args['FilterExpression'] = ' AND '.join(filters)
 
     try:
-        return events_table.query(**query_args)['Items']
+        items = dynamo_db.query(**query_args)['Items']
     except KeyError:
         raise Exception(f'Event information for {job_id} not found')
 
+    return [{k: deserialize(v) for k, v in item.items()} for item in items]
+
+
+# ------------------------------------------------------------------------------
+def scan_table(
+    dynamo_db: BaseClient,
+    segments: int = SCAN_SEGMENTS,
+    executor: ThreadPoolExecutor = None,
+    **scan_args,
+) -> list[dict[str, Any]]:
+    """
+    Do a full DynamoDB table scan with the segments scanned in parallel.
+
+    :param dynamo_db:   DynamoDB client. Clients, unlike resources, are thread safe.
+    :param segments:    Number of segments to split the scan into.
+    :param executor:    Thread pool for the segment scans. Defaults to the shared
+                        I/O pool. Don't use the pool this is running in.
+    :param scan_args:   Arguments for the DynamoDB scan. Must include TableName.
+
+    :return:            The scanned items, deserialised into Python types.
+    """
+
+    paginator = dynamo_db.get_paginator('scan')
+
+    def scan_segment(segment: int) -> list[dict[str, Any]]:
+        return [
+            {k: deserialize(v) for k, v in item.items()}
+            for page in paginator.paginate(Segment=segment, TotalSegments=segments, **scan_args)
+            for item in page.get('Items', [])
+        ]
+
+    executor = executor or _io_executor
+    return list(chain.from_iterable(executor.map(scan_segment, range(segments))))
+
+
+# ------------------------------------------------------------------------------
+def events_cache_path(*key) -> Path:
+    """Get the local events cache file for the given key components."""
+
+    return EVENTS_CACHE_DIR / (hashlib.sha256(repr(key).encode('utf-8')).hexdigest() + '.json')
+
+
+# ------------------------------------------------------------------------------
+def load_cached_events(path: Path, ttl: float) -> list[dict[str, Any]] | None:
+    """
+    Read events from the local events cache.
+
+    :param path:    Cache file.
+    :param ttl:     Maximum age of the cache file in seconds.
+    :return:        The events or None if the cache file is missing, too old or bad.
+    """
+
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+# ------------------------------------------------------------------------------
+def save_cached_events(path: Path, events: list[dict[str, Any]]):
+    """Save events in the local events cache. Failures are ignored."""
+
+    with suppress(OSError, TypeError, ValueError):
+        if orjson:
+            content = orjson.dumps(events, default=json_default)
+        else:
+            content = json.dumps(events, default=json_default).encode('utf-8')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+
+
+# ------------------------------------------------------------------------------
+def get_s3_text(
+    s3_client: BaseClient,
+    bucket: str,
+    key: str,
+    chunk_size: int = S3_READ_CHUNK_SIZE,
+    executor: ThreadPoolExecutor = None,
+) -> str:
+    """
+    Read a UTF-8 text object from S3.
+
+    The first chunk is read with a ranged GET which also tells us the object
+    size. Any remaining chunks are then read in parallel.
+
+    :param s3_client:   S3 client.
+    :param bucket:      Bucket name.
+    :param key:         Object key.
+    :param chunk_size:  Size of each ranged read in bytes.
+    :param executor:    Thread pool for the ranged reads. Defaults to a shared pool
+                        reserved for this. Don't use the pool this is running in.
+    :return:            The object contents.
+    """
+
+    def read_range(start: int) -> bytes:
+        return s3_client.get_object(
+            Bucket=bucket, Key=key, Range=f'bytes={start}-{start + chunk_size - 1}'
+        )['Body'].read()
+
+    try:
+        response = s3_client.get_object(Bucket=bucket, Key=key, Range=f'bytes=0-{chunk_size - 1}')
+    except ClientError as e:
+        # Ranged reads of empty objects are rejected
+        if e.response.get('Error', {}).get('Code') == 'InvalidRange':
+            return ''
+        raise
+    data = response['Body'].read()
+
+    # ContentRange looks like "bytes 0-8388607/12345678"
+    size = int(response.get('ContentRange', '').rpartition('/')[2] or len(data))
+    if size > len(data):
+        executor = executor or _s3_read_executor
+        data = b''.join([data, *executor.map(read_range, range(chunk_size, size, chunk_size))])
+    return data.decode('utf-8')
+
+
+# ------------------------------------------------------------------------------
+def get_s3_text_cached(s3_client: BaseClient, bucket: str, key: str) -> str:
+    """
+    Read a UTF-8 text object from S3, reusing an earlier read if it hasn't changed.
+
+    This costs a HEAD request to check the object's ETag but avoids downloading
+    the object again when the user returns to a log they have already seen.
+    """
+
+    etag = s3_client.head_object(Bucket=bucket, Key=key)['ETag']
+    return _get_s3_text_version(s3_client, bucket, key, etag)
+
+
+# ------------------------------------------------------------------------------
+@lru_cache(maxsize=S3_TEXT_CACHE_SIZE)
+def _get_s3_text_version(s3_client: BaseClient, bucket: str, key: str, etag: str) -> str:
+    """Read a given version (ETag) of an S3 text object. The ETag is just for the cache key."""
+    return get_s3_text(s3_client, bucket, key)
+
 
 # ------------------------------------------------------------------------------
 def get_event_logs_for_jobs(event_list: list[dict]) -> dict[str, Any]:
     """Search the event body for the mention of stdout or stderr files and return the S3 URIs."""
 
     log_files = {}
-    pattern_logs = r"(?<=('stderr': '|'stdout': '|'output': '))s3://[A-Za-z0-9_./-]+"
-    pattern_out = r's3://[A-Za-z0-9_.:/-]+\.out'
 
     for event in event_list:
-        log_files_for_event = {}
-
-        # Find matches for both patterns
-        for pattern in [pattern_logs, pattern_out]:
-            for log in re.finditer(pattern, repr(event)):
+        keyed_logs = {}
+        out_logs = {}
+        for key, value in iter_strings(event):
+            if 's3://' not in value:
+                continue
+            if key in LOG_FILE_KEYS and (log := LOG_FILE_KEYED_RE.match(value)):
+                log_uri = log.group(0)
+                keyed_logs[log_uri.rpartition('/')[2]] = log_uri
+            for log in LOG_FILE_OUT_RE.finditer(value):
                 log_uri = log.group(0)
-                log_files_for_event[log_uri.split('/')[-1]] = log_uri
+                out_logs[log_uri.rpartition('/')[2]] = log_uri
 
-        log_files[event['run_id']] = log_files_for_event
+        log_files[event['run_id']] = keyed_logs | out_logs
 
     return log_files
 
 
 # ------------------------------------------------------------------------------
-def get_job_globals(job_spec_s: str) -> dict:
-    """Get job globals from a JSON formatted job spec."""
+def iter_strings(obj: Any, key: Any = None) -> Iterator[tuple[Any, str]]:
+    """
+    Find all the strings in a nested structure of dicts, lists etc.
+
+    :param obj:     The object to search.
+    :param key:     The dict key for obj, if it's a dict value.
+    :return:        An iterator of (key, string) tuples. The key is the dict
+                    key for the string, or None if it's not a dict value.
+    """
+
+    if isinstance(obj, str):
+        yield key, obj
+    elif isinstance(obj, dict):
+        for k, v in obj.items():
+            yield from iter_strings(v, k)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for v in obj:
+            yield from iter_strings(v)
+
+
+# ------------------------------------------------------------------------------
+def pretty_json(obj: Any) -> str:
+    """
+    Format an object as indented JSON with sorted keys for display.
 
-    job_spec = json.loads(job_spec_s)
-    return job_spec.get('globals', {})
+    orjson is used, if available, when the configured indent is 2 as that is the
+    only indent it supports. It is much faster than the json module for large
+    job specs and events.
+    """
+
+    indent = GuiConfig().json_indent
+    if orjson and indent == 2:
+        return orjson.dumps(
+            obj,
+            default=json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        ).decode('utf-8')
+    return json.dumps(obj, indent=indent, sort_keys=True, default=json_default)
 
 
 # ------------------------------------------------------------------------------
-def get_job_params(job_spec_s: str) -> dict:
-    """Get job parameters from a JSON formatted job spec."""
+def format_dispatch_value(value: Any) -> str:
+    """
+    Convert a globals / parameters value to text for editing before a dispatch.
 
-    job_spec = json.loads(job_spec_s)
-    return job_spec.get('parameters', {})
+    Lists and dicts are shown as compact JSON. The json module is used rather
+    than orjson to keep the spaces after separators for readability.
+    """
+
+    if isinstance(value, DISPATCH_JSON_TYPES):
+        return json.dumps(value, default=json_default)
+    return str(value)
+
+
+# ------------------------------------------------------------------------------
+def parse_dispatch_value(value: str) -> Any:
+    """
+    Convert a globals / parameters value entered for a dispatch to a Python value.
+
+    Values are interpreted as JSON if possible. Otherwise, true / false / none
+    (case insensitive) and numbers are converted. Anything else is left as a string.
+    """
+
+    # Check the common literals first to avoid the cost of a failed JSON parse.
+    try:
+        return DISPATCH_LITERALS[value.lower()]
+    except KeyError:
+        pass
+
+    try:
+        return json_loads(value)
+    except json.JSONDecodeError:
+        pass
+
+    # NaN / Infinity are not valid JSON (orjson rejects them) so end up here.
+    if DISPATCH_NUMBER_RE.fullmatch(value):
+        return decimal.Decimal(value)
+    return value
+
+
+# ------------------------------------------------------------------------------
+def json_types(obj: Any) -> Any:
+    """
+    Convert a value from a DynamoDB item to the types a JSON round trip would give.
+
+    Numbers come back from DynamoDB as Decimal. These, and anything else JSON
+    can't represent, are converted as json_default() does for display.
+    """
+
+    if isinstance(obj, dict):
+        return {k: json_types(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [json_types(v) for v in obj]
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+    return json_default(obj)
+
+
+# ------------------------------------------------------------------------------
+def get_job_globals(job_spec: dict[str, Any]) -> dict:
+    """Get job globals from a job spec."""
+
+    return json_types(job_spec.get('globals', {}))
+
+
+# ------------------------------------------------------------------------------
+def get_job_params(job_spec: dict[str, Any]) -> dict:
+    """Get job parameters from a job spec."""
+
+    return json_types(job_spec.get('parameters', {}))
 
 
 # ------------------------------------------------------------------------------
@@ -2036,18 +2503,19 @@ def can_access_realm(realm: str, dynamo_db: BaseClient) -> bool:
 
 
 # ------------------------------------------------------------------------------
+@ttl_cache(maxsize=16, ttl=ACCOUNT_ACCESS_CACHE_TTL)
 def check_aws_account_access(profile_name: str):
     """
     Check if the specified AWS profile is able to access the account.
 
+    Successful checks are cached. Failures raise an exception and are not.
+
     :raise Exception: If AWS profile cannot be used to access the account or the
                     realms table in the account.
     """
 
-    current_connection = LavaAwsContext()
-    aws_session = current_connection.aws_session or boto3.Session(profile_name=profile_name)
     try:
-        aws_session.client('sts').get_caller_identity()
+        get_aws_client(profile_name, 'sts').get_caller_identity()
     except ClientError as e:
         try:
             raise Exception(e.response['Error']['Message'])
@@ -2055,7 +2523,7 @@ def check_aws_account_access(profile_name: str):
             raise e
 
     # Make sure we can get to the realms table
-    dynamodb = current_connection.dynamo_db_client or aws_session.client('dynamodb')
+    dynamodb = get_aws_client(profile_name, 'dynamodb')
     try:
         dynamodb.describe_table(TableName='lava.realms')
     except Exception as e:
@@ -2067,18 +2535,16 @@ def check_aws_account_access(profile_name: str):
 
 
 # ------------------------------------------------------------------------------
-@cache
+@ttl_cache(maxsize=16, ttl=REALM_LIST_CACHE_TTL)
 def accessible_realms(profile: str) -> list:
     """Get realms that are accessible for the given profile."""
     debug(f'Scanning accessible realms for profile: {profile}')
 
-    current_connection = LavaAwsContext()
-    aws_session = current_connection.aws_session or boto3.Session(profile_name=profile)
-    dynamo_db = current_connection.dynamo_db_client or aws_session.client('dynamodb')
+    dynamo_db = get_aws_client(profile, 'dynamodb')
     try:
         return [
             realm
-            for realm in scan_realms(aws_session=aws_session)
+            for realm in scan_realms(aws_session=get_aws_session(profile))
             if can_access_realm(realm, dynamo_db)
         ]
     except Exception as e:
@@ -2086,14 +2552,157 @@ def accessible_realms(profile: str) -> list:
         return []
 
 
-@ttl_cache(maxsize=3, ttl=15)
+# ------------------------------------------------------------------------------
 def fetch_job_list(
-    realm: str,
-    attributes: Iterable[str] | None = None,
-    aws_session: boto3.Session = None,
-):
-    """Handle job fetch is redone too frequently."""
-    return scan_jobs(realm=realm, attributes=attributes, aws_session=aws_session)
+    profile: str, realm: str, attributes: Iterable[str] | None = None
+) -> dict[str, dict[str, Any]]:
+    """
+    Get the jobs in a realm.
+
+    This does the same as lava's scan_jobs() but the table segments are scanned
+    in parallel.
+
+    :param profile:     AWS profile name.
+    :param realm:       Realm name.
+    :param attributes:  Job attributes to return in addition to the job ID.
+    :return:            A dictionary mapping job ID to selected job attributes.
+    """
+
+    attribute_names = {f'#{name}': name for name in attributes} if attributes else {}
+    attribute_names['#job_id'] = 'job_id'
+    items = scan_table(
+        get_aws_client(profile, 'dynamodb'),
+        TableName=f'lava.{realm}.jobs',
+        ProjectionExpression=','.join(attribute_names),
+        ExpressionAttributeNames=attribute_names,
+    )
+    return {item['job_id']: item for item in items}
+
+
+# ------------------------------------------------------------------------------
+@ttl_cache(maxsize=64, ttl=JOB_LIST_CACHE_TTL)
+def fetch_job_ids(profile: str, realm: str) -> list[str]:
+    """
+    Get the sorted job IDs in a realm. This is cached as the scan is expensive.
+
+    The list is sorted once here rather than on each use. It is shared between
+    callers and must not be modified.
+    """
+
+    return sorted(fetch_job_list(profile, realm))
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class JobDetails:
+    """A job spec along with the things derived from it for display."""
+
+    spec: dict[str, Any]
+    spec_json: str  # Formatted for display
+    globals: dict[str, Any]  # noqa: A003
+    parameters: dict[str, Any]
+
+
+# ------------------------------------------------------------------------------
+def fetch_job_spec(profile: str, realm: str, job_id: str) -> dict[str, Any]:
+    """Get a job spec."""
+    jobs_table = get_dynamodb_table(profile, f'lava.{realm}.jobs')
+    return get_job_spec(job_id, jobs_table=jobs_table)
+
+
+# ------------------------------------------------------------------------------
+@ttl_cache(maxsize=64, ttl=JOB_SPEC_CACHE_TTL)
+def fetch_job_details(profile: str, realm: str, job_id: str) -> JobDetails:
+    """
+    Get a job spec and format it for display.
+
+    This is cached briefly in case the user bounces between jobs. The formatting
+    is cached with the spec as it can cost more than the fetch for big specs.
+    The returned details are shared between callers and must not be modified.
+    """
+
+    job_spec = fetch_job_spec(profile, realm, job_id)
+    return JobDetails(
+        spec=job_spec,
+        spec_json=pretty_json(job_spec),
+        globals=get_job_globals(job_spec),
+        parameters=get_job_params(job_spec),
+    )
+
+
+# ------------------------------------------------------------------------------
+def preload_job_lists(profile: str, profile_cache: ProfileCache, realms: list[str]):
+    """
+    Load job lists for realms in the background so they're ready when selected.
+
+    Realms that already have a job list in the realm cache are skipped. The
+    results are only handed over by take_preloaded_job_ids(), on the caller's
+    thread. Nothing else is modified in the background.
+
+    :param profile:         AWS profile name.
+    :param profile_cache:   The realm caches for the profile.
+    :param realms:          Realms to preload. Only the first PRELOAD_REALMS
+                            that need it are done.
+    """
+
+    def preload(realm: str) -> list[str]:
+        return sorted(fetch_job_list(profile, realm))
+
+    realm_caches = profile_cache.realm_cache
+    todo = [
+        realm
+        for realm in realms
+        if realm not in realm_caches or realm_caches[realm].job_list is None
+    ]
+    with _preloads_lock:
+        for realm in todo[:PRELOAD_REALMS]:
+            if (profile, realm) not in _preloads:
+                _preloads[profile, realm] = _preload_executor.submit(preload, realm)
+
+
+# ------------------------------------------------------------------------------
+def take_preloaded_job_ids(profile: str, realm: str) -> list[str] | None:
+    """
+    Get a realm's preloaded job IDs, waiting for the preload if it's in flight.
+
+    :param profile:     AWS profile name.
+    :param realm:       Realm name.
+    :return:            Sorted job IDs or None if there's no usable preload. A
+                        preload that hasn't started yet is cancelled.
+    """
+
+    with _preloads_lock:
+        future = _preloads.pop((profile, realm), None)
+    if future is None or future.cancel():
+        return None
+    try:
+        return future.result()
+    except Exception as e:
+        debug(f'Preload of {realm} failed: {e}')
+        return None
+
+
+# ------------------------------------------------------------------------------
+def cancel_preloads():
+    """Discard all preloads. Any that are already running finish but are ignored."""
+
+    with _preloads_lock:
+        for future in _preloads.values():
+            future.cancel()
+        _preloads.clear()
+
+
+# ------------------------------------------------------------------------------
+def clear_lava_cache():
+    """Discard cached realm and job information so it gets reloaded from lava."""
+
+    accessible_realms.cache_clear()
+    fetch_job_ids.cache_clear()
+    fetch_job_details.cache_clear()
+    cancel_preloads()
+    for profile_cache in get_aws_context().profile_cache.values():
+        for realm_cache in profile_cache.realm_cache.values():
+            realm_cache.job_list = None
 
 
 # ------------------------------------------------------------------------------
@@ -2104,17 +2713,26 @@ def create_dropdown(
     """Create a default dropdown."""
     return ft.Dropdown(
         label=label,
-        label_style=DetailTextStyle(),
+        label_style=DETAIL_STYLE,
         options=[],
         width=150,
         on_change=on_change,
-        text_style=DetailTextStyle(),
+        text_style=DETAIL_STYLE,
         border_color=ft.Colors.PRIMARY,
         bgcolor=ft.Colors.SURFACE,
         autofocus=True,
     )
 
 
+# ------------------------------------------------------------------------------
+@cache
+def load_help_text() -> str:
+    """Get the help markdown. This is all the markdown files in the help directory."""
+
+    help_dir = Path(__file__).parent / 'assets' / 'help'
+    return '\n'.join(p.read_text(encoding='utf-8') for p in sorted(help_dir.glob('*.md')))
+
+
 # ------------------------------------------------------------------------------
 def create_tab_content(tab_title, content):
     """Create a default tab content."""
@@ -2127,7 +2745,7 @@ def create_tab_content(tab_title, content):
                 elevation=4,
                 content=ft.Column(controls=content, scroll=ft.ScrollMode.ALWAYS),
             ),
-            padding=ft.padding.all(10),
+            padding=PADDING_10,
         ),
     )
 
@@ -2153,11 +2771,12 @@ class SearchBar(ft.TextField):
         super().__init__(
             *args,
             label=label,
-            label_style=DetailTextStyle(),
+            label_style=DETAIL_STYLE,
             text_size=GuiConfig().details_font_size,
             hint_text='Search jobs...',
-            hint_style=DetailTextStyle(),
+            hint_style=DETAIL_STYLE,
             on_change=self.handle_search,  # Trigger filtering when the user types or backspaces
+            on_submit=self.handle_submit,  # Enter searches immediately
             expand=True,
             suffix_icon=ft.Icons.SEARCH,
             border_color=ft.Colors.PRIMARY,
@@ -2165,36 +2784,40 @@ class SearchBar(ft.TextField):
             **kwargs,
         )
 
-        self.search_timer: threading.Timer | None = None
+        # Bumped on each keystroke. A delayed search only runs if it's still current.
+        self.search_version = 0
         self.lava_jobs = lava_jobs
 
     # --------------------------------------------------------------------------
-    def handle_search(self, e: ft.ControlEvent):
+    async def handle_search(self, e: ft.ControlEvent):
         """Catch the keystroke in the search box and initiate a delayed update."""
 
-        # Cancel previous timer
-        if self.search_timer:
-            self.search_timer.cancel()
+        self.search_version += 1
+        version = self.search_version
+        await asyncio.sleep(SEARCH_DELAY)
+        if version == self.search_version:
+            self.perform_search(e.control.value)
 
-        # Set new timer
-        self.search_timer = threading.Timer(0.3, self.perform_search, args=[e.control.value])
-        self.search_timer.start()
+    # --------------------------------------------------------------------------
+    def handle_submit(self, e: ft.ControlEvent):
+        """Search immediately, dropping any pending delayed search."""
+
+        self.search_version += 1
+        self.perform_search(e.control.value)
 
     # --------------------------------------------------------------------------
     def perform_search(self, query: str):
         """Perform the actual search after a delay pending more keystrokes."""
         try:
-            search_query = query.lower().strip()
+            search_query = query.casefold().strip()
             if search_query is not None:
-                connecton_context = LavaAwsContext()
+                connecton_context = get_aws_context()
                 profile = connecton_context.profile
                 realm = connecton_context.realm
                 realm_cache = connecton_context.profile_cache[profile].realm_cache[realm]
                 realm_cache.last_search = search_query
 
-                filtered_jobs = [
-                    job for job in self.lava_jobs.original_job_list if search_query in job.lower()
-                ]
+                filtered_jobs = self.lava_jobs.filter_jobs(search_query)
             else:
                 filtered_jobs = self.lava_jobs.original_job_list
 
@@ -2221,6 +2844,8 @@ def handle_profile_change(
     Also refresh the realm dropdown based on the selected profile.
     """
 
+    # Preloads for the previous profile are no longer wanted.
+    cancel_preloads()
     lava_jobs_panel.update_job_list([])
     realm_dropdown.options = []
     realm_dropdown.update()
@@ -2228,7 +2853,7 @@ def handle_profile_change(
     job_details_markdown.update()
     os.environ['AWS_PROFILE'] = selected_profile
 
-    current_connection = LavaAwsContext()
+    current_connection = get_aws_context()
 
     try:
         current_connection.set_profile(selected_profile)
@@ -2239,7 +2864,7 @@ def handle_profile_change(
         return
 
     accessible_realms_list = sorted(accessible_realms(selected_profile))
-    realm_dropdown.text_style = DetailTextStyle()
+    realm_dropdown.text_style = DETAIL_STYLE
 
     realm_options = [ft.dropdown.Option(text=realm) for realm in accessible_realms_list]
     realm_dropdown.options = realm_options
@@ -2260,6 +2885,12 @@ def handle_profile_change(
     if realm_dropdown.value is not None:
         handle_realm_change(event, page, lava_jobs_panel, KEY_PAGE_REFERENCES['search_bar'])
 
+    preload_job_lists(
+        selected_profile,
+        profile_cache,
+        [realm for realm in accessible_realms_list if realm != realm_dropdown.value],
+    )
+
     # TODO: This is not working - seems to be a bug with Dropdown components
     realm_dropdown.update()
     if refresh_page:
@@ -2277,7 +2908,7 @@ def handle_realm_change(
 ):
     """Handle realm change event and update the job list."""
 
-    current_connection = LavaAwsContext()  # Access the singleton instance
+    current_connection = get_aws_context()
     realm = e.control.value
     if realm is None:
         return
@@ -2291,28 +2922,34 @@ def handle_realm_change(
 
     profile_cache.last_realm = realm
 
-    lava_jobs_panel.update_job_list(['Loading ...'])
-    try:
-        # Scan jobs for the selected realm
-        job_list = sorted(fetch_job_list(realm, aws_session=current_connection.aws_session))
-        current_connection.job_list = job_list
-        lava_jobs_panel.set_original_job_list(job_list)  # Update the unfiltered job list
-
-        # If realm cache has a last search, apply it
-        if realm_cache.last_search is not None:
-            search_bar.value = realm_cache.last_search
+    # If realm cache has a last search, apply it
+    if realm_cache.last_search is not None:
+        search_bar.value = realm_cache.last_search
 
+    def show_job_list(jobs: list[str]):
+        current_connection.job_list = jobs
+        lava_jobs_panel.set_original_job_list(jobs)  # Update the unfiltered job list
         # Checking if there is a search query in search bar.
-        search_query = search_bar.value.lower().strip()
-        if search_query:
-            filtered_jobs = [
-                job for job in lava_jobs_panel.original_job_list if search_query in job.lower()
-            ]
-        else:
-            filtered_jobs = lava_jobs_panel.original_job_list
-        lava_jobs_panel.update_job_list(filtered_jobs)
+        search_query = search_bar.value.casefold().strip()
+        lava_jobs_panel.update_job_list(lava_jobs_panel.filter_jobs(search_query))
+
+    if realm_cache.job_list is None:
+        lava_jobs_panel.update_job_list(['Loading ...'])
+    else:
+        # Show what we had last time while we check for changes
+        show_job_list(realm_cache.job_list)
+    try:
+        # Scan jobs for the selected realm
+        job_list = take_preloaded_job_ids(profile, realm)
+        if job_list is None:
+            job_list = fetch_job_ids(profile, realm)
+        if job_list != realm_cache.job_list:
+            realm_cache.job_list = job_list
+            show_job_list(job_list)
     except Exception as ex:
-        # Handle exceptions and display an error popup
+        # Handle exceptions and display an error popup. Selecting the realm
+        # again should retry so don't leave a job list looking current.
+        current_connection.job_list = []
         show_error_popup(page, f'Could not scan jobs: {ex}')
 
     else:
@@ -2350,7 +2987,7 @@ def job_list_view_click(
         job_logs_content (JobLogsContent): The JobLogsContent instance to update.
 
     """
-    current_connection = LavaAwsContext()
+    current_connection = get_aws_context()
     realm = current_connection.realm
     profile = current_connection.profile
 
@@ -2360,8 +2997,6 @@ def job_list_view_click(
         show_error_popup(page, 'Realm or profile is not selected.')
         return
 
-    dynamo_db = current_connection.dynamo_db_res
-    db_jobs_table = {realm: dynamo_db.Table(f'lava.{realm}.jobs')}
     current_connection.current_job = job
 
     try:
@@ -2369,8 +3004,16 @@ def job_list_view_click(
         realm_cache = current_connection.profile_cache[profile].realm_cache[realm]
         realm_cache.last_selected_job_id = job
 
+        # reset the previous row index of job_logs to prevent index error when switching jobs
+        job_logs_content.previous_selected_row_index = None
+        # As new job is selected, fetch some log entries for it. This runs in the
+        # background, overlapping the job spec fetch below, and updates the logs
+        # tab when the events arrive.
+        page.run_task(job_logs_content.fetch_events)
+
         # Fetch job specification
-        job_spec = get_job_spec(job, jobs_table=db_jobs_table[realm])
+        job_details = fetch_job_details(profile, realm, job)
+        job_spec = job_details.spec
         current_connection.job_spec = job_spec
 
         # Update worker text field
@@ -2378,20 +3021,21 @@ def job_list_view_click(
 
         # Job Details Tab
         # JSON formatting syntax
-        job_spec_s = json.dumps(
-            job_spec, indent=GuiConfig().json_indent, sort_keys=True, default=json_default
-        )
-        highlighted_job_spec_s = '```json\n' + job_spec_s
+        job_details_markdown.value = JSON_CODE_FENCE + job_details.spec_json
 
-        job_details_markdown.value = highlighted_job_spec_s
+        # If the job shown in the dispatch panel has been clicked again and its spec
+        # hasn't been refetched, leave the panel (and any edits the user has made) alone.
+        if job_details is job_dispatch_content.job_details:
+            page.update(job_worker_textfield, job_details_markdown)
+            return
 
         # Update JobDispatchContent fields
         job_dispatch_content.current_job_textfield.value = job
         job_dispatch_content.job_worker_textfield.value = job_spec.get('worker', 'N/A')
 
         # Extract globals and parameters of the job that was clicked
-        job_globals = get_job_globals(job_spec_s)
-        original_job_params = get_job_params(job_spec_s)
+        job_globals = job_details.globals
+        original_job_params = job_details.parameters
 
         job_dispatch_content.populate_tables(job_globals, original_job_params)
         job_dispatch_content.original_globals_data = (
@@ -2406,18 +3050,11 @@ def job_list_view_click(
 
         job_dispatch_content.status_icon.value = 'Status'
         job_dispatch_content.status_icon.color = ft.Colors.PRIMARY
+        job_dispatch_content.job_details = job_details
 
-        # As new job is selected, fetch some log entries for it.
-        job_logs_content.fetch_events()
-        # reset the previous row index of job_logs to prevent index error when switching jobs
-        job_logs_content.previous_selected_row_index = None
-
-        page.update(
-            job_worker_textfield,
-            job_details_markdown,
-            job_dispatch_content,
-            job_logs_content,
-        )
+        # The logs panel was updated when it was cleared and is updated again when
+        # the events arrive.
+        page.update(job_worker_textfield, job_details_markdown, job_dispatch_content)
 
     except Exception as e:
         show_error_popup(page, f'Failed to fetch job details: {e}')
@@ -2462,13 +3099,26 @@ def main(page: ft.Page):
         )
         help_content.code_theme = selected_theme.markdown_code_theme
 
-        # setting the current_theme in config file
-        key_of_selected_theme = next(
-            key for key, value in GUI_THEMES.items() if value == selected_theme
-        )
-        gui_config.set('current_theme', key_of_selected_theme)
+        # setting the current_theme in config file. GUI_THEMES is keyed on theme name.
+        gui_config.set('current_theme', selected_theme.name)
         page.update()
 
+    # --------------------------------------------------------------------------
+    # noinspection PyUnusedLocal
+    def refresh(e: ft.ControlEvent):
+        """Discard cached lava information and reload the current profile."""
+
+        clear_lava_cache()
+        if current_connection.profile:
+            handle_profile_change(
+                current_connection.profile,
+                page,
+                realm_dropdown,
+                lava_jobs_panel,
+                job_details_markdown,
+                refresh_page=True,
+            )
+
     # --------------------------------------------------------------------------
     def page_resized(e: ft.WindowResizeEvent):
         """Handle window resize."""
@@ -2478,8 +3128,14 @@ def main(page: ft.Page):
             window_chrome_height = gui_config.window_height - page.height
             window_chrome_width = gui_config.window_width - page.width
             return
-        gui_config.set('window_width', str(int(e.width) + window_chrome_width))
-        gui_config.set('window_height', str(int(e.height) + window_chrome_height))
+        # Resize events arrive in a stream while dragging. The config file write is
+        # deferred so this just publishes the latest size.
+        gui_config.update(
+            {
+                'window_width': int(e.width) + window_chrome_width,
+                'window_height': int(e.height) + window_chrome_height,
+            }
+        )
 
     # --------------------------------------------------------------------------
     # Get config and set defaults if needed
@@ -2489,12 +3145,12 @@ def main(page: ft.Page):
     gui_theme_name = gui_config.current_theme
     if gui_theme_name not in GUI_THEMES:
         debug(f'Theme {gui_theme_name} is not supported. so we changed it to our default.')
-        gui_config.set('current_theme', GuiConfig.defaults['current_theme'][0])
+        gui_config.set('current_theme', GuiConfig.defaults['current_theme'])
         gui_theme_name = gui_config.current_theme
 
     initial_theme = GUI_THEMES.get(gui_theme_name)
     page.theme_mode = ft.ThemeMode.LIGHT
-    page.title = app_info['tool']['flet']['product']
+    page.title = APP_PRODUCT
 
     page.theme = GUI_THEMES.get(gui_theme_name).base_theme  # setting the theme from config file
     page.bgcolor = page.theme.color_scheme.background
@@ -2505,10 +3161,9 @@ def main(page: ft.Page):
     page.window.height = gui_config.window_height
     page.window.width = gui_config.window_width
 
-    current_connection = LavaAwsContext()
+    current_connection = get_aws_context()
 
-    # This needs to be updated manually anytime you add a new theme
-    themes = [light_theme_gui_theme, dark_theme_gui_theme]
+    themes = list(GUI_THEMES.values())
 
     settings_dialog = SettingsDialog(page, themes, apply_theme)
     jobs_running = JobsRunning(lava_aws_context=current_connection, page=page)
@@ -2518,7 +3173,7 @@ def main(page: ft.Page):
         selectable=True,
         extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
         code_theme=initial_theme.markdown_code_theme,
-        code_style_sheet=ft.MarkdownStyleSheet(code_text_style=CodeTextStyle()),
+        code_style_sheet=ft.MarkdownStyleSheet(code_text_style=CODE_STYLE),
         on_tap_link=lambda event: page.launch_url(event.data),
     )
 
@@ -2566,33 +3221,49 @@ def main(page: ft.Page):
         ),
     )
 
-    realm_dropdown = create_dropdown(
-        'Realm', lambda event: handle_realm_change(event, page, lava_jobs_panel, search_bar)
-    )
+    # --------------------------------------------------------------------------
+    def realm_selected(e: ft.ControlEvent):
+        """Switch to the selected realm unless it's already the one being shown."""
+
+        realm = e.control.value
+        if realm == current_connection.realm and current_connection.profile:
+            realm_cache = current_connection.profile_cache[current_connection.profile].realm_cache
+            # Only skip if this realm's job list was loaded and is what's displayed.
+            job_list = realm_cache[realm].job_list if realm in realm_cache else None
+            if job_list is not None and job_list is current_connection.job_list:
+                return
+        handle_realm_change(e, page, lava_jobs_panel, search_bar)
+
+    realm_dropdown = create_dropdown('Realm', realm_selected)
 
     search_bar = SearchBar('Search Jobs', lava_jobs_panel)
 
     # Hold a reference to each of the key page elements
-    KEY_PAGE_REFERENCES['page'] = page
-    KEY_PAGE_REFERENCES['profile_dropdown'] = profile_dropdown
-    KEY_PAGE_REFERENCES['realm_dropdown'] = realm_dropdown
-    KEY_PAGE_REFERENCES['search_bar'] = search_bar
-    KEY_PAGE_REFERENCES['lava_jobs_panel'] = lava_jobs_panel
-    KEY_PAGE_REFERENCES['job_details_markdown'] = job_details_markdown
-    KEY_PAGE_REFERENCES['job_details_markdown'] = job_details_markdown
-    KEY_PAGE_REFERENCES['job_worker_textfield'] = job_worker_textfield
-    KEY_PAGE_REFERENCES['job_dispatch_content'] = job_dispatch_content
-    KEY_PAGE_REFERENCES['job_logs_content'] = job_logs_content
+    KEY_PAGE_REFERENCES.update(
+        page=page,
+        profile_dropdown=profile_dropdown,
+        realm_dropdown=realm_dropdown,
+        search_bar=search_bar,
+        lava_jobs_panel=lava_jobs_panel,
+        job_details_markdown=job_details_markdown,
+        job_worker_textfield=job_worker_textfield,
+        job_dispatch_content=job_dispatch_content,
+        job_logs_content=job_logs_content,
+    )
 
+    refresh_button = ft.IconButton(
+        icon=ft.Icons.REFRESH,
+        tooltip='Reload realms and jobs',
+        on_click=refresh,
+    )
     settings_button = ft.IconButton(
         icon=ft.Icons.SETTINGS,
         tooltip='Change Theme',
         on_click=lambda event: settings_dialog.open_dialog(),
     )
-    help_dir = Path(__file__).parent / 'assets' / 'help'
-    help_text = '\n'.join(p.read_text(encoding='utf-8') for p in sorted(help_dir.glob('*.md')))
+    # Help text is loaded when the help tab is first shown.
     help_content = ft.Markdown(
-        value=help_text,
+        value='',
         auto_follow_links=True,
         expand=True,
         extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
@@ -2615,12 +3286,12 @@ def main(page: ft.Page):
             h4_text_style=ft.TextStyle(
                 color=ft.Colors.PRIMARY, size=details_font_size, weight=ft.FontWeight.BOLD
             ),
-            p_text_style=DetailTextStyle(),
-            list_bullet_text_style=DetailTextStyle(),
-            table_head_text_style=DetailTextBoldStyle(),
-            table_body_text_style=DetailTextStyle(),
+            p_text_style=DETAIL_STYLE,
+            list_bullet_text_style=DETAIL_STYLE,
+            table_head_text_style=DETAIL_BOLD_STYLE,
+            table_body_text_style=DETAIL_STYLE,
             code_text_style=CodeTextStyle(color=ft.Colors.PRIMARY),
-            strong_text_style=DetailTextBoldStyle(),
+            strong_text_style=DETAIL_BOLD_STYLE,
         ),
     )
 
@@ -2628,6 +3299,14 @@ def main(page: ft.Page):
         padding=ft.Padding(left=5, right=5, top=3, bottom=3), expand=True, content=help_content
     )
 
+    help_tab = create_tab_content('Help', [help_container])
+
+    # noinspection PyUnusedLocal
+    def handle_tab_change(e: ft.ControlEvent):
+        if tabs.tabs[tabs.selected_index] is help_tab and not help_content.value:
+            help_content.value = load_help_text()
+            help_content.update()
+
     # Tabs
     tabs = ft.Tabs(
         divider_color='#CCCCCC',
@@ -2640,8 +3319,9 @@ def main(page: ft.Page):
             create_tab_content('Job Dispatch', [job_dispatch_content]),
             create_tab_content('Job Logs', [job_logs_content]),
             create_tab_content('Jobs Currently Running', [jobs_running]),
-            create_tab_content('Help', [help_container]),
+            help_tab,
         ],
+        on_change=handle_tab_change,
     )
 
     left_hand_panel = ft.Container(
@@ -2658,6 +3338,7 @@ def main(page: ft.Page):
                             profile_dropdown,
                             realm_dropdown,
                             search_bar,
+                            refresh_button,
                             settings_button,
                         ],
                         alignment=ft.MainAxisAlignment.START,
@@ -2692,7 +3373,7 @@ def main(page: ft.Page):
     # Add components to the page
     page.add(
         ft.Container(
-            margin=ft.margin.only(bottom=10),
+            margin=MARGIN_BOTTOM_10,
             expand=1,
             content=ft.Row(
                 controls=[
@@ -2714,8 +3395,11 @@ def main(page: ft.Page):
     # Set profiles and update the page
     set_profiles(profile_dropdown)
 
-    # User may have aws_profile value that is incompatible.
-    if profile_from_config is not None and profile_from_config != '':
+    # --------------------------------------------------------------------------
+    def load_initial_profile():
+        """Select the profile from config. This hits AWS so it's run in the background."""
+
+        # User may have aws_profile value that is incompatible.
         try:
             handle_profile_change(
                 profile_from_config, page, realm_dropdown, lava_jobs_panel, job_details_markdown
@@ -2728,10 +3412,15 @@ def main(page: ft.Page):
             )
             profile_dropdown.value = 'default'
             debug(f'Exception: {ex}. So we swapped to default.')
+        profile_dropdown.update()
 
     profile_dropdown.update()
     page.update()
 
+    # Show the window before going anywhere near AWS.
+    if profile_from_config is not None and profile_from_config != '':
+        page.run_thread(load_initial_profile)
+
 
 # ------------------------------------------------------------------------------
 ft.app(target=main)
@@ -0,0 +1,64 @@
+"""Tests for lib.config."""
+
+from __future__ import annotations
+
+from configparser import ConfigParser
+
+import pytest
+
+from lib.config import GuiConfig
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def make_config(tmp_path, monkeypatch):
+    """Get a factory for a fresh GuiConfig reading the given file content."""
+
+    cfg_file = tmp_path / 'lava.cfg'
+    monkeypatch.setattr(GuiConfig, 'cfg_file', cfg_file)
+    configs = []
+
+    def factory(content: str) -> GuiConfig:
+        cfg_file.write_text(content)
+        monkeypatch.setattr(GuiConfig, '_instance', None)
+        cfg = GuiConfig()
+        configs.append(cfg)
+        return cfg
+
+    yield factory
+    for cfg in configs:
+        cfg.flush()
+
+
+# ------------------------------------------------------------------------------
+def test_default_section_is_inherited(make_config):
+    cfg = make_config('[DEFAULT]\ncode_font_size = 14\n')
+
+    assert cfg.code_font_size == 14
+    assert cfg.get('code_font_size') == 14
+    assert cfg['code_font_size'] == 14
+    assert cfg.set_default('code_font_size', 11) == '14'
+    # Built-in defaults still fill in anything [DEFAULT] doesn't have.
+    assert cfg.details_font_size == 10
+
+
+# ------------------------------------------------------------------------------
+def test_default_section_not_written_to_gui(make_config):
+    cfg = make_config('[DEFAULT]\ncode_font_size = 14\n\n[GUI]\njson_indent = 2\n')
+    cfg.flush()
+
+    parser = ConfigParser(interpolation=None)
+    parser.read(cfg.cfg_file)
+    assert parser.defaults()['code_font_size'] == '14'
+    assert 'code_font_size' not in parser._sections['GUI']  # noqa: SLF001
+    assert parser['GUI']['json_indent'] == '2'
+
+    # The user's [DEFAULT] value survives a reload.
+    assert make_config(cfg.cfg_file.read_text()).code_font_size == 14
+
+
+# ------------------------------------------------------------------------------
+def test_gui_section_overrides_default_section(make_config):
+    cfg = make_config('[DEFAULT]\ncode_font_size = 14\n\n[GUI]\ncode_font_size = 16\n')
+
+    assert cfg.code_font_size == 16
@@ -0,0 +1,42 @@
+"""Tests for lib.utils."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from lib.utils import round_half_up
+
+
+# ------------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    'n, expected',
+    [
+        (0.5, 1),
+        (1.5, 2),
+        (2.5, 3),
+        (-0.5, -1),
+        (-2.5, -3),
+        (0.49999999999999994, 0),
+        (-0.49999999999999994, 0),
+        (4503599627370495.5, 4503599627370496),
+        (2.0**53 + 2, 2**53 + 2),
+        (10**20 + 1, 10**20 + 1),
+        (-(10**20) - 1, -(10**20) - 1),
+        (Decimal('2.5'), 3),
+        (Decimal('-2.5'), -3),
+        ('0.5', 1),
+    ],
+)
+def test_round_half_up(n, expected):
+    result = round_half_up(n)
+    assert result == expected
+    assert isinstance(result, int)
+
+
+# ------------------------------------------------------------------------------
+@pytest.mark.parametrize('n', [float('inf'), float('nan')])
+def test_round_half_up_non_finite(n):
+    with pytest.raises((OverflowError, ValueError)):
+        round_half_up(n)